@@ -4,6 +4,8 @@ Event handling module for the Solutions Architect Simulator.
 from typing import Any, Dict, List, Optional, Tuple
 import pygame
 
+from ui.ui_manager import TOOLTIP_EVENT
+
 
 class EventHandler:
     """Handles pygame events and dispatches them to appropriate handlers."""
@@ -30,6 +32,9 @@ class EventHandler:
                 self._handle_mouse_up(event)
             elif event.type == pygame.MOUSEMOTION:
                 self._handle_mouse_motion(event)
+            elif event.type == TOOLTIP_EVENT:
+                # One-shot tooltip delay elapsed
+                self.game.ui_manager.on_tooltip_timer()
             elif event.type == pygame.USEREVENT:
                 # Handle custom events
                 self._handle_user_event(event)
@@ -84,14 +84,17 @@ class Game:
                 self.show_completion_screen = False
                 self.completion_screen = None
         else:
+            # Read the clock once and share the timestamp across managers
+            current_time = pygame.time.get_ticks()
+
             # Update the current level
             self.level_manager.update()
-            
+
             # Update time manager
-            self.time_manager.update()
-            
+            self.time_manager.update(current_time)
+
             # Update UI components
-            self.ui_manager.update()
+            self.ui_manager.update(current_time)
     
     def render(self) -> None:
         """Render the game to the screen."""
@@ -22,20 +22,22 @@ class TimeManager:
         self.last_update_time = 0
         self.time_out = False
     
-    def update(self) -> None:
-        """Update time-related game state."""
+    def update(self, current_time: int) -> None:
+        """
+        Update time-related game state.
+
+        Args:
+            current_time: Frame timestamp from pygame.time.get_ticks()
+        """
         # Only update time in TIME_TRIAL mode
         from core.state import GameMode
         if self.game.state.mode != GameMode.TIME_TRIAL:
             return
-            
+
         # Skip if time has already run out
         if self.time_out:
             return
-            
-        # Get current time
-        current_time = pygame.time.get_ticks()
-        
+
         # Initialize last_update_time if this is the first update
         if self.last_update_time == 0:
             self.last_update_time = current_time
@@ -328,6 +328,11 @@ class Level1(BaseLevel):
         Returns:
             Service ID if found, None otherwise
         """
+        # Broad-phase reject: anything outside the panel strip cannot hit
+        # a service entry, so skip the per-service scan entirely
+        if not self.service_panel_rect.collidepoint(pos):
+            return None
+
         for service_id, rect in self.service_rects.items():
             if rect.collidepoint(pos):
                 return service_id
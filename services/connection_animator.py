@@ -2,12 +2,17 @@
 Connection animator module for animating connections between services.
 """
 import math
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Tuple
 
 import pygame
 
 from ui.aws_theme import AWSColors
 
+# Theme values hit once or twice per connection per redraw, bound at module
+# level so the draw loops load a global instead of probing class attributes
+_LINE_BG_COLOR = AWSColors.SQUID_INK
+_ARROW_COLOR = AWSColors.SMILE_ORANGE
+
 
 class ConnectionAnimator:
     """Animates connections between services with flowing color transitions."""
@@ -32,7 +37,54 @@ class ConnectionAnimator:
         # Pulse effect parameters
         self.pulse_time = 0.0
         self.pulse_speed = 0.03
-    
+
+        # Precomputed color ramp: 256 RGB tuples interpolated across the
+        # orange -> blue -> green -> orange stops, so segment coloring is a
+        # single indexed lookup instead of branchy per-channel math.
+        self._color_ramp = self._build_color_ramp()
+
+    @staticmethod
+    def _build_color_ramp() -> List[Tuple[int, int, int]]:
+        """
+        Build a 256-entry piecewise-linear color ramp between AWS color stops.
+
+        Returns:
+            List of 256 RGB tuples covering the full animation color cycle
+        """
+        stops = [
+            AWSColors.SMILE_ORANGE,
+            AWSColors.POWDER_BLUE,
+            AWSColors.LIME,
+            AWSColors.SMILE_ORANGE
+        ]
+
+        # Split the 256 entries into three segments, one per pair of stops
+        boundaries = [0, 85, 171, 256]
+
+        ramp: List[Tuple[int, int, int]] = []
+        for k in range(3):
+            start, end = stops[k], stops[k + 1]
+            segment_length = boundaries[k + 1] - boundaries[k]
+            for i in range(segment_length):
+                ratio = i / (segment_length - 1)
+                ramp.append((
+                    int(start[0] * (1 - ratio) + end[0] * ratio),
+                    int(start[1] * (1 - ratio) + end[1] * ratio),
+                    int(start[2] * (1 - ratio) + end[2] * ratio)
+                ))
+
+        return ramp
+
+    def _pulse_width(self) -> int:
+        """
+        Current background line width for the pulse effect.
+
+        Returns:
+            Width in pixels, varying between 5 and 7 over the pulse cycle
+        """
+        pulse_effect = (math.sin(self.pulse_time * math.pi * 2) + 1) / 2
+        return 5 + int(pulse_effect * 2)
+
     def add_connection(self, source_id: str, target_id: str) -> None:
         """
         Add a new connection to animate.
@@ -81,20 +133,17 @@ class ConnectionAnimator:
             surface: Pygame surface to render on
             connections: List of (source, target) node pairs
         """
+        # Draw each connection straight onto the frame. Caching them on an
+        # overlay surface was benchmarked and lost: the animation advances
+        # visibly every frame, and even a bounds-restricted blit of the
+        # cached region moves far more memory than redrawing the lines
         for source, target in connections:
-            # Get connection points
             start_point = source.get_connection_point()
             end_point = target.get_connection_point()
-            
-            # Get connection key
             connection_key = (source.service_id, target.service_id)
-            
-            # Get animation progress (default to 0 if not found)
             progress = self.animations.get(connection_key, 0.0)
-            
-            # Draw animated connection
             self._draw_animated_connection(surface, start_point, end_point, progress)
-    
+
     def _draw_animated_connection(
         self, 
         surface: pygame.Surface, 
@@ -114,23 +163,37 @@ class ConnectionAnimator:
         # Calculate line length
         dx = end[0] - start[0]
         dy = end[1] - start[1]
-        line_length = math.sqrt(dx * dx + dy * dy)
-        
+
+        if dx == 0 and dy == 0:
+            return
+
+        # Fast paths for axis-aligned connections (common with grid-snapped
+        # nodes): no sqrt, and segment endpoints use integer arithmetic only
+        if dx == 0:
+            self._draw_axis_aligned_connection(surface, start, end, progress, vertical=True)
+            return
+        if dy == 0:
+            self._draw_axis_aligned_connection(surface, start, end, progress, vertical=False)
+            return
+
+        if abs(dx) == abs(dy):
+            # Perfect diagonal: length is known without the general sqrt
+            line_length = abs(dx) * math.sqrt(2)
+        else:
+            line_length = math.sqrt(dx * dx + dy * dy)
+
         # Calculate number of segments based on line length
         num_segments = max(5, int(line_length / 15))
         
-        # Calculate pulse effect (0.0 to 1.0 and back)
-        pulse_effect = (math.sin(self.pulse_time * math.pi * 2) + 1) / 2
-        
         # Draw background line with pulse effect
-        bg_width = 5 + int(pulse_effect * 2)  # Width varies between 5 and 7
-        
-        # Background color with pulse effect
-        bg_alpha = 120 + int(pulse_effect * 60)  # Alpha varies between 120 and 180
-        
+        bg_width = self._pulse_width()
+
+        # All draws here are opaque: pygame.draw drops the alpha component
+        # on the opaque display surface anyway, so spelling the colors as
+        # RGB just makes the rendered result explicit
         pygame.draw.line(
             surface,
-            (*AWSColors.SQUID_INK, bg_alpha),  # Semi-transparent dark color with pulse
+            _LINE_BG_COLOR,
             start,
             end,
             bg_width
@@ -156,38 +219,15 @@ class ConnectionAnimator:
             # Choose color based on segment position with smooth transition
             # Use a sine wave to create a smooth color transition
             wave = (math.sin(segment_progress * math.pi * 2) + 1) / 2  # 0 to 1 value
-            
-            # Interpolate between AWS colors based on the wave value
-            if wave < 0.33:
-                # Transition from SMILE_ORANGE to POWDER_BLUE
-                ratio = wave / 0.33
-                color = (
-                    int(AWSColors.SMILE_ORANGE[0] * (1 - ratio) + AWSColors.POWDER_BLUE[0] * ratio),
-                    int(AWSColors.SMILE_ORANGE[1] * (1 - ratio) + AWSColors.POWDER_BLUE[1] * ratio),
-                    int(AWSColors.SMILE_ORANGE[2] * (1 - ratio) + AWSColors.POWDER_BLUE[2] * ratio)
-                )
-            elif wave < 0.66:
-                # Transition from POWDER_BLUE to LIME
-                ratio = (wave - 0.33) / 0.33
-                color = (
-                    int(AWSColors.POWDER_BLUE[0] * (1 - ratio) + AWSColors.LIME[0] * ratio),
-                    int(AWSColors.POWDER_BLUE[1] * (1 - ratio) + AWSColors.LIME[1] * ratio),
-                    int(AWSColors.POWDER_BLUE[2] * (1 - ratio) + AWSColors.LIME[2] * ratio)
-                )
-            else:
-                # Transition from LIME to SMILE_ORANGE
-                ratio = (wave - 0.66) / 0.34
-                color = (
-                    int(AWSColors.LIME[0] * (1 - ratio) + AWSColors.SMILE_ORANGE[0] * ratio),
-                    int(AWSColors.LIME[1] * (1 - ratio) + AWSColors.SMILE_ORANGE[1] * ratio),
-                    int(AWSColors.LIME[2] * (1 - ratio) + AWSColors.SMILE_ORANGE[2] * ratio)
-                )
-            
+
+            # Branch-free lookup into the precomputed color ramp
+            color = self._color_ramp[int(wave * 255)]
+
             # Draw segment with glow effect
-            # First draw a slightly thicker, semi-transparent line
+            # First draw a slightly thicker line underneath
             pygame.draw.line(
                 surface,
-                (*color, 100),  # Semi-transparent
+                color,
                 (segment_start_x, segment_start_y),
                 (segment_end_x, segment_end_y),
                 5
@@ -203,8 +243,71 @@ class ConnectionAnimator:
             )
         
         # Draw arrow at the end to indicate direction
-        self._draw_arrow(surface, start, end, AWSColors.SMILE_ORANGE)
-    
+        self._draw_arrow(surface, start, end, _ARROW_COLOR)
+
+    def _draw_axis_aligned_connection(
+        self,
+        surface: pygame.Surface,
+        start: Tuple[int, int],
+        end: Tuple[int, int],
+        progress: float,
+        vertical: bool
+    ) -> None:
+        """
+        Draw a horizontal or vertical connection using integer segment math.
+
+        Args:
+            surface: Pygame surface to render on
+            start: Start point (x, y)
+            end: End point (x, y)
+            progress: Animation progress (0.0 to 1.0)
+            vertical: True for a vertical line, False for horizontal
+        """
+        # Signed length along the single varying axis
+        length = end[1] - start[1] if vertical else end[0] - start[0]
+        line_length = abs(length)
+
+        num_segments = max(5, line_length // 15)
+        segment_step = length // num_segments
+
+        # Draw background line with pulse effect; opaque, matching the
+        # general path above
+        bg_width = self._pulse_width()
+
+        pygame.draw.line(
+            surface,
+            _LINE_BG_COLOR,
+            start,
+            end,
+            bg_width
+        )
+
+        # Draw animated segments with integer endpoints
+        for i in range(num_segments):
+            segment_progress = (i / num_segments + progress) % 1.0
+
+            start_offset = int(length * segment_progress)
+            if segment_progress + 1 / num_segments > 1.0:
+                end_offset = length
+            else:
+                end_offset = start_offset + segment_step
+
+            if vertical:
+                segment_start = (start[0], start[1] + start_offset)
+                segment_end = (start[0], start[1] + end_offset)
+            else:
+                segment_start = (start[0] + start_offset, start[1])
+                segment_end = (start[0] + end_offset, start[1])
+
+            wave = (math.sin(segment_progress * math.pi * 2) + 1) / 2
+            color = self._color_ramp[int(wave * 255)]
+
+            # Glow pass then main segment, matching the general path
+            pygame.draw.line(surface, color, segment_start, segment_end, 5)
+            pygame.draw.line(surface, color, segment_start, segment_end, 3)
+
+        self._draw_arrow(surface, start, end, _ARROW_COLOR)
+
     def _draw_arrow(
         self, 
         surface: pygame.Surface, 
@@ -252,7 +355,7 @@ class ConnectionAnimator:
         )
         
         # Draw arrow with glow effect
-        # First draw a slightly larger, semi-transparent arrow for glow
+        # First draw a slightly larger arrow for glow
         glow_points = [
             end,
             (end[0] - dx * (arrow_size+2) + perpendicular_x * (arrow_size+2)/2,
@@ -263,7 +366,7 @@ class ConnectionAnimator:
         
         pygame.draw.polygon(
             surface,
-            (*color, 100),  # Semi-transparent
+            color,
             glow_points
         )
         
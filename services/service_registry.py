@@ -4,6 +4,7 @@ Service registry module for managing AWS service definitions.
 import json
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Optional, Set, Tuple
 
 
@@ -24,6 +25,7 @@ class ServiceRegistry:
     """Registry for AWS services used in the game."""
     
     _services: Dict[str, ServiceInfo] = {}
+    _by_category: Dict[str, Dict[str, ServiceInfo]] = {}
     _initialized: bool = False
     
     @classmethod
@@ -49,14 +51,23 @@ class ServiceRegistry:
                     latency_ms=data["latency_ms"],
                     connection_rules=data["connection_rules"]
                 )
-        
+
+        # Precompute category buckets once; services are static after init,
+        # so category lookups become a single dict fetch
+        for service_id, info in cls._services.items():
+            cls._by_category.setdefault(info.category, {})[service_id] = info
+
         cls._initialized = True
     
     @classmethod
+    @lru_cache(maxsize=None)
     def get_service(cls, service_id: str) -> Optional[ServiceInfo]:
         """
         Get service information by ID.
-        
+
+        Memoized: the registry is static after initialize(), so repeated
+        lookups from hot loops bypass the dict probe entirely.
+
         Args:
             service_id: ID of the service to retrieve
             
@@ -94,9 +105,5 @@ class ServiceRegistry:
         """
         if not cls._initialized:
             cls.initialize()
-            
-        return {
-            service_id: info
-            for service_id, info in cls._services.items()
-            if info.category == category
-        }
\ No newline at end of file
+
+        return cls._by_category.get(category, {})
\ No newline at end of file
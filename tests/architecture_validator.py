@@ -1,14 +1,197 @@
 """
 Architecture validator module for evaluating architecture designs.
 """
-from typing import Dict, List, Optional, Set, Tuple
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Set, Tuple
 
 from services.service_registry import ServiceRegistry
 
 
+@dataclass
+class _RequireEdge:
+    """Rule: a specific connection must exist."""
+    source: str
+    target: str
+    message: str
+
+    def failure_condition(self) -> str:
+        return f"({self.source!r}, {self.target!r}) not in connections"
+
+
+@dataclass
+class _RequireEdgeIf:
+    """Rule: if a service is present, a specific connection must exist."""
+    condition_service: str
+    source: str
+    target: str
+    message: str
+
+    def failure_condition(self) -> str:
+        return (
+            f"{self.condition_service!r} in services"
+            f" and ({self.source!r}, {self.target!r}) not in connections"
+        )
+
+
+@dataclass
+class _RequireAnyEdge:
+    """Rule: at least one of several connections must exist."""
+    edges: Tuple[Tuple[str, str], ...]
+    message: str
+
+    def failure_condition(self) -> str:
+        alternatives = " or ".join(f"({s!r}, {t!r}) in connections" for s, t in self.edges)
+        return f"not ({alternatives})"
+
+
+@dataclass
+class _RequireSource:
+    """Rule: a service must appear as the source of some connection."""
+    service: str
+    message: str
+
+    def failure_condition(self) -> str:
+        return f"{self.service!r} not in sources"
+
+
+@dataclass
+class _RequireTarget:
+    """Rule: a service must appear as the target of some connection."""
+    service: str
+    message: str
+
+    def failure_condition(self) -> str:
+        return f"{self.service!r} not in targets"
+
+
+@dataclass
+class _RequireAnyService:
+    """Rule: at least one of several services must be present."""
+    candidates: Tuple[str, ...]
+    message: str
+
+    def failure_condition(self) -> str:
+        alternatives = " or ".join(f"{service!r} in services" for service in self.candidates)
+        return f"not ({alternatives})"
+
+
+# Declarative per-level validation rules, compiled once at import time.
+# Each entry is (success_message, rules); rules are checked in order and
+# every failing rule contributes one issue.
+_LEVEL_RULES: Dict[int, Tuple[str, tuple]] = {
+    1: ("Blog API architecture validated successfully!", (
+        _RequireEdge("api_gateway", "lambda", "API Gateway must be connected to Lambda for request processing"),
+        _RequireEdge("lambda", "dynamodb", "Lambda must be connected to DynamoDB for data storage"),
+        _RequireEdge("lambda", "s3", "Lambda must be connected to S3 for media storage"),
+        _RequireEdgeIf("iam", "iam", "lambda", "IAM role must be connected to Lambda for permissions"),
+    )),
+    2: ("Static Portfolio Site architecture validated successfully!", (
+        _RequireEdge("cloudfront", "s3", "CloudFront must be connected to S3 for content delivery"),
+        _RequireEdgeIf("waf", "waf", "cloudfront", "WAF must be connected to CloudFront for protection"),
+        _RequireEdgeIf("lambda", "lambda", "s3", "Lambda should be connected to S3 for dynamic content"),
+    )),
+    3: ("Secure User Authentication architecture validated successfully!", (
+        _RequireEdge("cognito", "api_gateway", "Cognito must be connected to API Gateway for authentication"),
+        _RequireEdge("api_gateway", "lambda", "API Gateway must be connected to Lambda for processing"),
+        _RequireEdge("lambda", "secrets_manager", "Lambda must be connected to Secrets Manager for secure credentials"),
+    )),
+    4: ("Real-time Chat Service architecture validated successfully!", (
+        _RequireEdge("api_gateway", "lambda", "API Gateway must be connected to Lambda for WebSocket handling"),
+        _RequireEdge("lambda", "sqs", "Lambda must be connected to SQS for message queuing"),
+        _RequireEdge("lambda", "sns", "Lambda must be connected to SNS for notifications"),
+        _RequireEdge("lambda", "dynamodb", "Lambda must be connected to DynamoDB for message storage"),
+    )),
+    5: ("IoT Data Pipeline architecture validated successfully!", (
+        _RequireEdge("kinesis", "lambda", "Kinesis must be connected to Lambda for data processing"),
+        _RequireEdge("lambda", "s3", "Lambda must be connected to S3 for data storage"),
+        _RequireAnyEdge((("s3", "redshift"), ("lambda", "redshift")),
+                        "Either S3 or Lambda must be connected to Redshift for data warehousing"),
+    )),
+    6: ("High-Volume Payment System architecture validated successfully!", (
+        _RequireEdge("vpc", "ec2", "EC2 instances must be in a VPC"),
+        _RequireEdge("vpc", "rds", "RDS must be in a VPC"),
+        _RequireEdge("auto_scaling", "ec2", "Auto Scaling must be connected to EC2 for scalability"),
+        _RequireEdge("alb", "ec2", "ALB must be connected to EC2 for load balancing"),
+    )),
+    7: ("HIPAA Compliant Healthcare API architecture validated successfully!", (
+        _RequireEdge("waf", "api_gateway", "WAF must be connected to API Gateway for protection"),
+        _RequireEdge("api_gateway", "lambda", "API Gateway must be connected to Lambda for processing"),
+        _RequireEdge("lambda", "dynamodb", "Lambda must be connected to DynamoDB for data storage"),
+        _RequireEdge("kms", "dynamodb", "KMS must be connected to DynamoDB for encryption"),
+        _RequireSource("cloudtrail", "CloudTrail must be connected for audit logging"),
+    )),
+    8: ("Video CDN and Transcoding architecture validated successfully!", (
+        _RequireAnyEdge((("s3", "media_convert"), ("lambda", "media_convert")),
+                        "Either S3 or Lambda must be connected to MediaConvert for transcoding"),
+        _RequireEdge("media_convert", "s3", "MediaConvert must be connected to S3 for output storage"),
+        _RequireEdge("cloudfront", "s3", "CloudFront must be connected to S3 for content delivery"),
+        _RequireTarget("lambda", "Lambda must be used for workflow orchestration"),
+    )),
+    9: ("Microservices Architecture validated successfully!", (
+        _RequireAnyService(("ecs", "eks"), "Either ECS or EKS must be used for container orchestration"),
+        _RequireSource("app_mesh", "App Mesh must be used for service mesh"),
+        _RequireSource("alb", "ALB must be used for load balancing"),
+        _RequireTarget("dynamodb", "DynamoDB must be used for product catalog"),
+        _RequireTarget("s3", "S3 must be used for static assets"),
+    )),
+    10: ("Secure FinTech Platform architecture validated successfully!", (
+        _RequireSource("cloudhsm", "CloudHSM must be used for key management"),
+        _RequireSource("guardduty", "GuardDuty must be used for threat detection"),
+        _RequireSource("macie", "Macie must be used for data protection"),
+        _RequireEdge("vpc", "rds", "RDS must be in a VPC"),
+        _RequireEdge("vpc", "ec2", "EC2 instances must be in a VPC"),
+        _RequireEdge("alb", "ec2", "ALB must be connected to EC2 for load balancing"),
+    )),
+}
+
+
+def _compile_level_validator(level_id: int, success_message: str, rules: tuple):
+    """
+    Generate a specialized validator function for one level's rule table.
+
+    The rules are partially evaluated into straight-line code (one `if` per
+    rule with the IDs and message inlined), so steady-state validation runs
+    native bytecode instead of interpreting the rule objects.
+
+    Args:
+        level_id: ID of the level
+        success_message: Message returned when all rules pass
+        rules: The level's rule table
+
+    Returns:
+        Function taking (services, connections, sources, targets)
+    """
+    name = f"_validate_level_{level_id}_compiled"
+    lines = [
+        f"def {name}(services, connections, sources, targets):",
+        "    issues = []",
+    ]
+    for rule in rules:
+        lines.append(f"    if {rule.failure_condition()}:")
+        lines.append(f"        issues.append({rule.message!r})")
+    lines += [
+        "    if issues:",
+        "        return (False, 'Architecture issue: ' + issues[0], tuple(issues))",
+        f"    return (True, {success_message!r}, ())",
+    ]
+
+    namespace: Dict[str, object] = {}
+    exec("\n".join(lines), namespace)
+    return namespace[name]
+
+
+# Compiled validators, one per level, built from _LEVEL_RULES at import time
+_COMPILED_VALIDATORS = {
+    level_id: _compile_level_validator(level_id, success_message, rules)
+    for level_id, (success_message, rules) in _LEVEL_RULES.items()
+}
+
+
 class ArchitectureValidator:
     """Validates AWS architectures against level requirements."""
-    
+
     @classmethod
     def validate_architecture(
         cls,
@@ -20,416 +203,150 @@ class ArchitectureValidator:
     ) -> Tuple[bool, str, List[str]]:
         """
         Validate an architecture against level-specific requirements.
-        
+
         Args:
             level_id: ID of the level
             services: List of service IDs in the architecture
             connections: List of connections between services
             required_services: Set of required services for the level
             optional_services: Set of optional services for the level
-            
-        Returns:
-            Tuple of (is_valid, message, issues)
-        """
-        # Check if all required services are present
-        missing_services = required_services - set(services)
-        if missing_services:
-            return (
-                False,
-                f"Missing required services: {', '.join(missing_services)}",
-                [f"Missing: {service}" for service in missing_services]
-            )
-        
-        # Check for level-specific requirements
-        if level_id == 1:
-            return cls._validate_level1(services, connections)
-        elif level_id == 2:
-            return cls._validate_level2(services, connections)
-        elif level_id == 3:
-            return cls._validate_level3(services, connections)
-        elif level_id == 4:
-            return cls._validate_level4(services, connections)
-        elif level_id == 5:
-            return cls._validate_level5(services, connections)
-        elif level_id == 6:
-            return cls._validate_level6(services, connections)
-        elif level_id == 7:
-            return cls._validate_level7(services, connections)
-        elif level_id == 8:
-            return cls._validate_level8(services, connections)
-        elif level_id == 9:
-            return cls._validate_level9(services, connections)
-        elif level_id == 10:
-            return cls._validate_level10(services, connections)
-        
-        # Default validation for unknown levels
-        return (True, "Architecture meets basic requirements", [])
-    
-    @classmethod
-    def _validate_level1(cls, services: List[str], connections: List[Tuple[str, str]]) -> Tuple[bool, str, List[str]]:
-        """
-        Validate Level 1: Blog API architecture.
-        
-        Args:
-            services: List of service IDs in the architecture
-            connections: List of connections between services
-            
-        Returns:
-            Tuple of (is_valid, message, issues)
-        """
-        issues = []
-        
-        # Check for API Gateway to Lambda connection
-        if not cls._has_connection("api_gateway", "lambda", connections):
-            issues.append("API Gateway must be connected to Lambda for request processing")
-        
-        # Check for Lambda to DynamoDB connection
-        if not cls._has_connection("lambda", "dynamodb", connections):
-            issues.append("Lambda must be connected to DynamoDB for data storage")
-        
-        # Check for Lambda to S3 connection
-        if not cls._has_connection("lambda", "s3", connections):
-            issues.append("Lambda must be connected to S3 for media storage")
-        
-        # Check for IAM role if present
-        if "iam" in services and not cls._has_connection("iam", "lambda", connections):
-            issues.append("IAM role must be connected to Lambda for permissions")
-        
-        if issues:
-            return (False, f"Architecture issue: {issues[0]}", issues)
-        
-        return (True, "Blog API architecture validated successfully!", [])
-    
-    @classmethod
-    def _validate_level2(cls, services: List[str], connections: List[Tuple[str, str]]) -> Tuple[bool, str, List[str]]:
-        """
-        Validate Level 2: Static Portfolio Site architecture.
-        
-        Args:
-            services: List of service IDs in the architecture
-            connections: List of connections between services
-            
-        Returns:
-            Tuple of (is_valid, message, issues)
-        """
-        issues = []
-        
-        # Check for CloudFront to S3 connection
-        if not cls._has_connection("cloudfront", "s3", connections):
-            issues.append("CloudFront must be connected to S3 for content delivery")
-        
-        # Check for WAF if present
-        if "waf" in services and not cls._has_connection("waf", "cloudfront", connections):
-            issues.append("WAF must be connected to CloudFront for protection")
-        
-        # Check for Lambda if present
-        if "lambda" in services and not cls._has_connection("lambda", "s3", connections):
-            issues.append("Lambda should be connected to S3 for dynamic content")
-        
-        if issues:
-            return (False, f"Architecture issue: {issues[0]}", issues)
-        
-        return (True, "Static Portfolio Site architecture validated successfully!", [])
-    
-    @classmethod
-    def _validate_level3(cls, services: List[str], connections: List[Tuple[str, str]]) -> Tuple[bool, str, List[str]]:
-        """
-        Validate Level 3: Secure User Authentication architecture.
-        
-        Args:
-            services: List of service IDs in the architecture
-            connections: List of connections between services
-            
-        Returns:
-            Tuple of (is_valid, message, issues)
-        """
-        issues = []
-        
-        # Check for Cognito to API Gateway connection
-        if not cls._has_connection("cognito", "api_gateway", connections):
-            issues.append("Cognito must be connected to API Gateway for authentication")
-        
-        # Check for API Gateway to Lambda connection
-        if not cls._has_connection("api_gateway", "lambda", connections):
-            issues.append("API Gateway must be connected to Lambda for processing")
-        
-        # Check for Lambda to Secrets Manager connection
-        if not cls._has_connection("lambda", "secrets_manager", connections):
-            issues.append("Lambda must be connected to Secrets Manager for secure credentials")
-        
-        if issues:
-            return (False, f"Architecture issue: {issues[0]}", issues)
-        
-        return (True, "Secure User Authentication architecture validated successfully!", [])
-    
-    @classmethod
-    def _validate_level4(cls, services: List[str], connections: List[Tuple[str, str]]) -> Tuple[bool, str, List[str]]:
-        """
-        Validate Level 4: Real-time Chat Service architecture.
-        
-        Args:
-            services: List of service IDs in the architecture
-            connections: List of connections between services
-            
-        Returns:
-            Tuple of (is_valid, message, issues)
-        """
-        issues = []
-        
-        # Check for API Gateway to Lambda connection
-        if not cls._has_connection("api_gateway", "lambda", connections):
-            issues.append("API Gateway must be connected to Lambda for WebSocket handling")
-        
-        # Check for Lambda to SQS connection
-        if not cls._has_connection("lambda", "sqs", connections):
-            issues.append("Lambda must be connected to SQS for message queuing")
-        
-        # Check for Lambda to SNS connection
-        if not cls._has_connection("lambda", "sns", connections):
-            issues.append("Lambda must be connected to SNS for notifications")
-        
-        # Check for Lambda to DynamoDB connection
-        if not cls._has_connection("lambda", "dynamodb", connections):
-            issues.append("Lambda must be connected to DynamoDB for message storage")
-        
-        if issues:
-            return (False, f"Architecture issue: {issues[0]}", issues)
-        
-        return (True, "Real-time Chat Service architecture validated successfully!", [])
-    
-    @classmethod
-    def _validate_level5(cls, services: List[str], connections: List[Tuple[str, str]]) -> Tuple[bool, str, List[str]]:
-        """
-        Validate Level 5: IoT Data Pipeline architecture.
-        
-        Args:
-            services: List of service IDs in the architecture
-            connections: List of connections between services
-            
-        Returns:
-            Tuple of (is_valid, message, issues)
-        """
-        issues = []
-        
-        # Check for Kinesis to Lambda connection
-        if not cls._has_connection("kinesis", "lambda", connections):
-            issues.append("Kinesis must be connected to Lambda for data processing")
-        
-        # Check for Lambda to S3 connection
-        if not cls._has_connection("lambda", "s3", connections):
-            issues.append("Lambda must be connected to S3 for data storage")
-        
-        # Check for S3 to Redshift connection or Lambda to Redshift connection
-        if not (cls._has_connection("s3", "redshift", connections) or cls._has_connection("lambda", "redshift", connections)):
-            issues.append("Either S3 or Lambda must be connected to Redshift for data warehousing")
-        
-        if issues:
-            return (False, f"Architecture issue: {issues[0]}", issues)
-        
-        return (True, "IoT Data Pipeline architecture validated successfully!", [])
-    
-    @classmethod
-    def _validate_level6(cls, services: List[str], connections: List[Tuple[str, str]]) -> Tuple[bool, str, List[str]]:
-        """
-        Validate Level 6: High-Volume Payment System architecture.
-        
-        Args:
-            services: List of service IDs in the architecture
-            connections: List of connections between services
-            
-        Returns:
-            Tuple of (is_valid, message, issues)
-        """
-        issues = []
-        
-        # Check for VPC to EC2 connection
-        if not cls._has_connection("vpc", "ec2", connections):
-            issues.append("EC2 instances must be in a VPC")
-        
-        # Check for VPC to RDS connection
-        if not cls._has_connection("vpc", "rds", connections):
-            issues.append("RDS must be in a VPC")
-        
-        # Check for Auto Scaling to EC2 connection
-        if not cls._has_connection("auto_scaling", "ec2", connections):
-            issues.append("Auto Scaling must be connected to EC2 for scalability")
-        
-        # Check for ALB to EC2 connection
-        if not cls._has_connection("alb", "ec2", connections):
-            issues.append("ALB must be connected to EC2 for load balancing")
-        
-        if issues:
-            return (False, f"Architecture issue: {issues[0]}", issues)
-        
-        return (True, "High-Volume Payment System architecture validated successfully!", [])
-    
-    @classmethod
-    def _validate_level7(cls, services: List[str], connections: List[Tuple[str, str]]) -> Tuple[bool, str, List[str]]:
-        """
-        Validate Level 7: HIPAA Compliant Healthcare API architecture.
-        
-        Args:
-            services: List of service IDs in the architecture
-            connections: List of connections between services
-            
-        Returns:
-            Tuple of (is_valid, message, issues)
-        """
-        issues = []
-        
-        # Check for WAF to API Gateway connection
-        if not cls._has_connection("waf", "api_gateway", connections):
-            issues.append("WAF must be connected to API Gateway for protection")
-        
-        # Check for API Gateway to Lambda connection
-        if not cls._has_connection("api_gateway", "lambda", connections):
-            issues.append("API Gateway must be connected to Lambda for processing")
-        
-        # Check for Lambda to DynamoDB connection
-        if not cls._has_connection("lambda", "dynamodb", connections):
-            issues.append("Lambda must be connected to DynamoDB for data storage")
-        
-        # Check for KMS to DynamoDB connection
-        if not cls._has_connection("kms", "dynamodb", connections):
-            issues.append("KMS must be connected to DynamoDB for encryption")
-        
-        # Check for CloudTrail connection
-        if not any(source == "cloudtrail" for source, _ in connections):
-            issues.append("CloudTrail must be connected for audit logging")
-        
-        if issues:
-            return (False, f"Architecture issue: {issues[0]}", issues)
-        
-        return (True, "HIPAA Compliant Healthcare API architecture validated successfully!", [])
-    
-    @classmethod
-    def _validate_level8(cls, services: List[str], connections: List[Tuple[str, str]]) -> Tuple[bool, str, List[str]]:
-        """
-        Validate Level 8: Video CDN and Transcoding architecture.
-        
-        Args:
-            services: List of service IDs in the architecture
-            connections: List of connections between services
-            
-        Returns:
-            Tuple of (is_valid, message, issues)
-        """
-        issues = []
-        
-        # Check for S3 to MediaConvert connection or Lambda to MediaConvert connection
-        if not (cls._has_connection("s3", "media_convert", connections) or cls._has_connection("lambda", "media_convert", connections)):
-            issues.append("Either S3 or Lambda must be connected to MediaConvert for transcoding")
-        
-        # Check for MediaConvert to S3 connection
-        if not cls._has_connection("media_convert", "s3", connections):
-            issues.append("MediaConvert must be connected to S3 for output storage")
-        
-        # Check for CloudFront to S3 connection
-        if not cls._has_connection("cloudfront", "s3", connections):
-            issues.append("CloudFront must be connected to S3 for content delivery")
-        
-        # Check for Lambda connection for workflow orchestration
-        if not any(target == "lambda" for _, target in connections):
-            issues.append("Lambda must be used for workflow orchestration")
-        
-        if issues:
-            return (False, f"Architecture issue: {issues[0]}", issues)
-        
-        return (True, "Video CDN and Transcoding architecture validated successfully!", [])
-    
-    @classmethod
-    def _validate_level9(cls, services: List[str], connections: List[Tuple[str, str]]) -> Tuple[bool, str, List[str]]:
-        """
-        Validate Level 9: Microservices Architecture.
-        
-        Args:
-            services: List of service IDs in the architecture
-            connections: List of connections between services
-            
+
         Returns:
             Tuple of (is_valid, message, issues)
         """
-        issues = []
-        
-        # Check for ECS or EKS
-        if "ecs" not in services and "eks" not in services:
-            issues.append("Either ECS or EKS must be used for container orchestration")
-        
-        # Check for App Mesh connection
-        if not any(source == "app_mesh" for source, _ in connections):
-            issues.append("App Mesh must be used for service mesh")
-        
-        # Check for ALB connection
-        if not any(source == "alb" for source, _ in connections):
-            issues.append("ALB must be used for load balancing")
-        
-        # Check for DynamoDB connection
-        if not any(target == "dynamodb" for _, target in connections):
-            issues.append("DynamoDB must be used for product catalog")
-        
-        # Check for S3 connection
-        if not any(target == "s3" for _, target in connections):
-            issues.append("S3 must be used for static assets")
-        
-        if issues:
-            return (False, f"Architecture issue: {issues[0]}", issues)
-        
-        return (True, "Microservices Architecture validated successfully!", [])
-    
+        # Intern IDs arriving from JSON/user input so the hashed comparisons
+        # below reduce to pointer checks against the module's literals
+        services = [sys.intern(service) for service in services]
+        connections = [(sys.intern(source), sys.intern(target)) for source, target in connections]
+
+        # Canonicalize to hashable keys and hit the memoized implementation;
+        # UIs tend to re-validate every tick with unchanged inputs
+        is_valid, message, issues = _validate_cached(
+            level_id,
+            frozenset(services),
+            frozenset(connections),
+            frozenset(required_services),
+            frozenset(optional_services)
+        )
+        return (is_valid, message, list(issues))
+
     @classmethod
-    def _validate_level10(cls, services: List[str], connections: List[Tuple[str, str]]) -> Tuple[bool, str, List[str]]:
+    def validate_all_levels(
+        cls,
+        services: List[str],
+        connections: List[Tuple[str, str]],
+        required_map: Dict[int, Set[str]],
+        optional_map: Dict[int, Set[str]]
+    ) -> Dict[int, Tuple[bool, str, List[str]]]:
         """
-        Validate Level 10: Secure FinTech Platform architecture.
-        
+        Validate one architecture against every known level in a single pass.
+
+        Canonicalizes the inputs once and reuses them across all level rule
+        tables, instead of paying the set conversions per level as repeated
+        validate_architecture calls would.
+
         Args:
             services: List of service IDs in the architecture
             connections: List of connections between services
-            
-        Returns:
-            Tuple of (is_valid, message, issues)
-        """
-        issues = []
-        
-        # Check for CloudHSM for key management
-        if not any(source == "cloudhsm" for source, _ in connections):
-            issues.append("CloudHSM must be used for key management")
-        
-        # Check for GuardDuty for threat detection
-        if not any(source == "guardduty" for source, _ in connections):
-            issues.append("GuardDuty must be used for threat detection")
-        
-        # Check for Macie for data protection
-        if not any(source == "macie" for source, _ in connections):
-            issues.append("Macie must be used for data protection")
-        
-        # Check for VPC to RDS connection
-        if not cls._has_connection("vpc", "rds", connections):
-            issues.append("RDS must be in a VPC")
-        
-        # Check for VPC to EC2 connection
-        if not cls._has_connection("vpc", "ec2", connections):
-            issues.append("EC2 instances must be in a VPC")
-        
-        # Check for ALB to EC2 connection
-        if not cls._has_connection("alb", "ec2", connections):
-            issues.append("ALB must be connected to EC2 for load balancing")
-        
-        if issues:
-            return (False, f"Architecture issue: {issues[0]}", issues)
-        
-        return (True, "Secure FinTech Platform architecture validated successfully!", [])
-    
-    @staticmethod
-    def _has_connection(source: str, target: str, connections: List[Tuple[str, str]]) -> bool:
-        """
-        Check if there is a connection between source and target.
-        
-        Args:
-            source: Source service ID
-            target: Target service ID
-            connections: List of connections between services
-            
+            required_map: Required services per level ID
+            optional_map: Optional services per level ID
+
         Returns:
-            True if connection exists, False otherwise
+            Dictionary of level ID to (is_valid, message, issues)
         """
-        return (source, target) in connections
\ No newline at end of file
+        services = [sys.intern(service) for service in services]
+        connections = [(sys.intern(source), sys.intern(target)) for source, target in connections]
+
+        services_set = frozenset(services)
+        connections_set = frozenset(connections)
+        sources = frozenset(source for source, _ in connections)
+        targets = frozenset(target for _, target in connections)
+
+        results: Dict[int, Tuple[bool, str, List[str]]] = {}
+        for level_id in sorted(_COMPILED_VALIDATORS):
+            required_services = required_map.get(level_id, set())
+            missing_services = [service for service in required_services if service not in services_set]
+            if missing_services:
+                results[level_id] = (
+                    False,
+                    f"Missing required services: {', '.join(missing_services)}",
+                    [f"Missing: {service}" for service in missing_services]
+                )
+                continue
+
+            is_valid, message, issues = _run_rules(
+                level_id, services_set, connections_set, sources, targets
+            )
+            results[level_id] = (is_valid, message, list(issues))
+
+        return results
+
+
+@lru_cache(maxsize=256)
+def _validate_cached(
+    level_id: int,
+    services: FrozenSet[str],
+    connections: FrozenSet[Tuple[str, str]],
+    required_services: FrozenSet[str],
+    optional_services: FrozenSet[str]
+) -> Tuple[bool, str, Tuple[str, ...]]:
+    """
+    Memoized validation over canonicalized (hashable) inputs.
+
+    Args:
+        level_id: ID of the level
+        services: Set of service IDs in the architecture
+        connections: Set of connections between services
+        required_services: Set of required services for the level
+        optional_services: Set of optional services for the level
+
+    Returns:
+        Tuple of (is_valid, message, issues) with issues as a tuple
+    """
+    # Index connection endpoints once for the "any source/target is X"
+    # style rules used by the later levels
+    sources = frozenset(source for source, _ in connections)
+    targets = frozenset(target for _, target in connections)
+
+    # Check if all required services are present; collect the missing ones
+    # directly instead of materializing a difference set just to test it
+    missing_services = [service for service in required_services if service not in services]
+    if missing_services:
+        return (
+            False,
+            f"Missing required services: {', '.join(missing_services)}",
+            tuple(f"Missing: {service}" for service in missing_services)
+        )
+
+    return _run_rules(level_id, services, connections, sources, targets)
+
+
+def _run_rules(
+    level_id: int,
+    services: FrozenSet[str],
+    connections: FrozenSet[Tuple[str, str]],
+    sources: FrozenSet[str],
+    targets: FrozenSet[str]
+) -> Tuple[bool, str, Tuple[str, ...]]:
+    """
+    Run a level's rule table over preprocessed inputs.
+
+    Module-level rather than a classmethod: the rule engine carries no class
+    state and skipping descriptor binding keeps the hot path lean.
+
+    Args:
+        level_id: ID of the level
+        services: Set of service IDs in the architecture
+        connections: Set of connections between services
+        sources: Set of service IDs that appear as a connection source
+        targets: Set of service IDs that appear as a connection target
+
+    Returns:
+        Tuple of (is_valid, message, issues) with issues as a tuple
+    """
+    validator = _COMPILED_VALIDATORS.get(level_id)
+    if validator is None:
+        # Default validation for unknown levels
+        return (True, "Architecture meets basic requirements", ())
+
+    return validator(services, connections, sources, targets)
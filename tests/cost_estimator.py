@@ -1,10 +1,23 @@
 """
 Cost estimator module for calculating architecture costs.
 """
+import sys
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 from services.service_registry import ServiceRegistry
 
+# Level-specific cost multipliers; levels beyond the map pay full price
+_LEVEL_DISCOUNT = {1: 0.5, 2: 0.6, 3: 0.7, 4: 0.8, 5: 0.8}
+
+# Data transfer cost per billable connection, reduced for beginner levels
+_DT_COST_PER_CONNECTION = {1: 2.0, 2: 3.0}
+
+# Connections that never incur data transfer costs; early levels also
+# waive the Lambda-to-S3 transfer
+_FREE_EDGES = frozenset({("cloudfront", "s3"), ("lambda", "dynamodb")})
+_FREE_EDGES_EARLY = _FREE_EDGES | {("lambda", "s3")}
+
 
 class CostEstimator:
     """Estimates the cost of AWS architectures."""
@@ -27,37 +40,68 @@ class CostEstimator:
             connections: List of connections between services (source_id, target_id)
             level_id: Optional level ID to apply level-specific adjustments
             
+        Returns:
+            Estimated monthly cost in USD
+        """
+        # Intern IDs arriving from JSON/user input so the hashed comparisons
+        # below reduce to pointer checks against the module's literals
+        services = [sys.intern(service) for service in services]
+        connections = [(sys.intern(source), sys.intern(target)) for source, target in connections]
+
+        # Canonicalize to hashable keys and hit the memoized implementation;
+        # the HUD re-estimates every tick with mostly unchanged inputs
+        return _estimate_cached(tuple(sorted(services)), tuple(sorted(connections)), level_id)
+
+    @classmethod
+    def _estimate_monthly_cost_uncached(
+        cls,
+        services: List[str],
+        connections: List[Tuple[str, str]],
+        level_id: Optional[int] = None
+    ) -> float:
+        """
+        Compute the monthly cost estimate without caching.
+
+        Args:
+            services: List of service IDs in the architecture
+            connections: List of connections between services (source_id, target_id)
+            level_id: Optional level ID to apply level-specific adjustments
+
         Returns:
             Estimated monthly cost in USD
         """
         total_cost = 0.0
         
         # Apply level-specific discount factor
-        discount_factor = 1.0
-        if level_id == 1:
-            discount_factor = 0.5  # 50% discount for level 1
-        elif level_id == 2:
-            discount_factor = 0.6  # 40% discount for level 2
-        elif level_id == 3:
-            discount_factor = 0.7  # 30% discount for level 3
-        elif level_id and level_id <= 5:
-            discount_factor = 0.8  # 20% discount for levels 4-5
+        discount_factor = _LEVEL_DISCOUNT.get(level_id, 1.0) if level_id else 1.0
         
-        # Calculate base service costs
-        for service_id in services:
-            service_info = ServiceRegistry.get_service(service_id)
+        # Lambda's invocation adjustment is constant for a given architecture,
+        # so answer it once instead of scanning connections per Lambda entry
+        lambda_triggered = ("api_gateway", "lambda") in connections
+
+        # Look up each distinct service once; duplicates reuse the same info
+        service_infos = {
+            service_id: ServiceRegistry.get_service(service_id)
+            for service_id in set(services)
+        }
+
+        # Fold rate, adjustment and discount into one monthly cost per
+        # distinct service, then reduce over the full list in a single
+        # C-level sum instead of a per-entry Python loop
+        monthly_costs = {}
+        for service_id, service_info in service_infos.items():
             if service_info:
-                # Calculate monthly cost based on hourly rate
                 service_cost = service_info.cost_per_hour * cls.HOURS_PER_MONTH
-                
-                # Apply service-specific adjustments
-                service_cost = cls._adjust_service_cost(service_id, service_cost, services, connections, level_id)
-                
-                # Apply level discount
-                service_cost *= discount_factor
-                
-                total_cost += service_cost
-        
+                service_cost = cls._adjust_service_cost(
+                    service_id, service_cost, services, connections, level_id,
+                    lambda_triggered=lambda_triggered
+                )
+                monthly_costs[service_id] = service_cost * discount_factor
+            else:
+                monthly_costs[service_id] = 0.0
+
+        total_cost += sum(monthly_costs[service_id] for service_id in services)
+
         # Calculate data transfer costs
         data_transfer_cost = cls._calculate_data_transfer_cost(services, connections, level_id)
         total_cost += data_transfer_cost
@@ -71,27 +115,32 @@ class CostEstimator:
         base_cost: float,
         services: List[str],
         connections: List[Tuple[str, str]],
-        level_id: Optional[int] = None
+        level_id: Optional[int] = None,
+        lambda_triggered: Optional[bool] = None
     ) -> float:
         """
         Apply service-specific cost adjustments.
-        
+
         Args:
             service_id: ID of the service
             base_cost: Base monthly cost
             services: List of all services in the architecture
             connections: List of connections between services
             level_id: Optional level ID to apply level-specific adjustments
-            
+            lambda_triggered: Precomputed "API Gateway triggers Lambda" flag;
+                derived from connections when not provided
+
         Returns:
             Adjusted cost
         """
         adjusted_cost = base_cost
-        
+
         # Apply service-specific adjustments
         if service_id == "lambda":
             # Lambda costs less if it's not frequently invoked
-            if not any(source == "api_gateway" for source, target in connections if target == "lambda"):
+            if lambda_triggered is None:
+                lambda_triggered = ("api_gateway", "lambda") in connections
+            if not lambda_triggered:
                 adjusted_cost *= 0.5
             
             # Additional discount for early levels
@@ -154,34 +203,40 @@ class CostEstimator:
         # In a real implementation, this would be more complex based on actual data transfer patterns
         
         # Base data transfer cost per connection (adjusted by level)
-        if level_id == 1:
-            # Level 1: Reduced data transfer cost for beginners
-            cost_per_connection = 2.0
-        elif level_id == 2:
-            # Level 2: Slightly higher but still beginner-friendly
-            cost_per_connection = 3.0
-        else:
-            # Higher levels: Standard data transfer cost
-            cost_per_connection = 5.0
-        
-        # Count connections that incur data transfer costs
-        billable_connections = 0
-        for source, target in connections:
-            # Skip connections if either service doesn't exist anymore
-            if source not in services or target not in services:
-                continue
-                
-            # Skip connections that don't incur data transfer costs
-            if source == "cloudfront" and target == "s3":
-                continue
-            if source == "lambda" and target == "dynamodb":
-                continue
-            if source == "lambda" and target == "s3":
-                # Lambda to S3 has reduced cost in early levels
-                if level_id and level_id <= 2:
-                    continue
-            
-            # Count billable connections
-            billable_connections += 1
+        cost_per_connection = _DT_COST_PER_CONNECTION.get(level_id, 5.0)
         
-        return billable_connections * cost_per_connection
\ No newline at end of file
+        # Hash the service list once so the per-edge membership tests are O(1)
+        services_set = services if isinstance(services, (set, frozenset)) else set(services)
+
+        # One hashed lookup per edge replaces the chained skip branches
+        free_edges = _FREE_EDGES_EARLY if (level_id and level_id <= 2) else _FREE_EDGES
+
+        # Count billable connections in one pass: edges between services that
+        # still exist and that aren't in the free set incur transfer costs
+        billable_connections = sum(
+            1 for source, target in connections
+            if source in services_set and target in services_set
+            and (source, target) not in free_edges
+        )
+
+        return billable_connections * cost_per_connection
+
+
+@lru_cache(maxsize=256)
+def _estimate_cached(
+    services: Tuple[str, ...],
+    connections: Tuple[Tuple[str, str], ...],
+    level_id: Optional[int]
+) -> float:
+    """
+    Memoized cost estimation over canonicalized (hashable) inputs.
+
+    Args:
+        services: Sorted tuple of service IDs in the architecture
+        connections: Sorted tuple of connections between services
+        level_id: Optional level ID to apply level-specific adjustments
+
+    Returns:
+        Estimated monthly cost in USD
+    """
+    return CostEstimator._estimate_monthly_cost_uncached(list(services), list(connections), level_id)
\ No newline at end of file
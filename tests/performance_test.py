@@ -1,6 +1,9 @@
 """
 Performance test module for evaluating architecture performance.
 """
+from array import array
+from collections import defaultdict
+from functools import lru_cache
 from typing import Dict, List, Optional, Set, Tuple
 
 from services.service_registry import ServiceRegistry
@@ -23,168 +26,303 @@ class PerformanceTest:
             services: List of service IDs in the architecture
             connections: List of connections between services (source_id, target_id)
             
+        Returns:
+            Estimated latency in milliseconds
+        """
+        # The estimate is pure given the static registry, so canonicalize
+        # to hashable keys and hit the memoized implementation
+        return _latency_cached(tuple(sorted(services)), tuple(sorted(connections)), level_id)
+
+    @classmethod
+    def _estimate_latency_uncached(
+        cls,
+        services: Tuple[str, ...],
+        connections: Tuple[Tuple[str, str], ...],
+        level_id: Optional[int] = None
+    ) -> float:
+        """
+        Compute the latency estimate without caching.
+
+        Args:
+            services: Service IDs in the architecture
+            connections: Connections between services (source_id, target_id)
+            level_id: Optional level ID (unused; kept for interface parity)
+
         Returns:
             Estimated latency in milliseconds
         """
         if not services:
             return 0.0
-        
-        # Calculate base service latencies
+
+        # Calculate base service latencies, binding the registry lookup to a
+        # local to skip the attribute resolution per service
         service_latencies = {}
+        get_service = ServiceRegistry.get_service
         for service_id in services:
-            service_info = ServiceRegistry.get_service(service_id)
+            service_info = get_service(service_id)
             if service_info:
                 service_latencies[service_id] = service_info.latency_ms
         
-        # Build a graph of the architecture
-        graph = cls._build_graph(connections)
-        
-        # Find the critical path (path with highest latency)
-        entry_points = cls._find_entry_points(graph)
+        # Encode node IDs as dense ints once; all graph work below hashes
+        # and indexes small ints instead of re-hashing ID strings
+        node_ids = sorted({source for source, _ in connections} | {target for _, target in connections})
+        index_of = {service_id: index for index, service_id in enumerate(node_ids)}
+        coded_connections = [(index_of[source], index_of[target]) for source, target in connections]
+        coded_latencies = [service_latencies.get(service_id, 0.0) for service_id in node_ids]
+
+        # Pack the graph into CSR arrays: neighbors live in one contiguous
+        # int array sliced by indptr, instead of per-node list objects
+        num_nodes = len(node_ids)
+        indptr, indices = cls._build_csr(coded_connections, num_nodes)
+
+        # Find the critical path with a longest-path DP over a topological
+        # order: O(V+E) instead of enumerating every simple path per
+        # entry/exit pair, which is exponential on wide DAGs
+        max_latency = _critical_path_latency(indptr, indices, coded_latencies)
+        if max_latency >= 0.0:
+            return max_latency
+
+        # Cyclic graph: fall back to exhaustive simple-path search. One DFS
+        # per entry covers every exit, instead of repeating the search for
+        # each (entry, exit) pair
+        graph, indegrees = cls._build_graph(coded_connections)
+        entry_points = cls._find_entry_points(graph, indegrees)
         exit_points = cls._find_exit_points(graph)
-        
+        latency_by_code = dict(enumerate(coded_latencies))
+
         max_latency = 0.0
         for entry in entry_points:
+            best = cls._max_latency_from(entry, graph, latency_by_code)
             for exit in exit_points:
-                path_latency = cls._calculate_path_latency(entry, exit, graph, service_latencies)
-                max_latency = max(max_latency, path_latency)
-        
+                max_latency = max(max_latency, best.get(exit, 0.0))
+
         return max_latency
-    
+
+    @classmethod
+    def _max_latency_from(
+        cls,
+        start: int,
+        graph: Dict[int, List[int]],
+        service_latencies: Dict[int, float]
+    ) -> Dict[int, float]:
+        """
+        Compute the maximum simple-path latency from start to every node.
+
+        The DFS runs over an explicit stack of neighbor iterators, so the
+        search depth is bounded by memory rather than the interpreter's
+        recursion limit — long chains inside a cycle are valid input here.
+
+        Args:
+            start: Starting node code
+            graph: Graph as an adjacency list over int-coded nodes
+            service_latencies: Latency per node code
+
+        Returns:
+            Dictionary of node code to highest latency of any simple path
+            from start ending at that node
+        """
+        get_latency = service_latencies.get
+
+        start_latency = get_latency(start, 0.0)
+        best: Dict[int, float] = {start: start_latency}
+
+        # Parallel stacks: the path's nodes, the running latency sum at
+        # each depth, and a neighbor iterator per frame
+        visited = {start}
+        nodes = [start]
+        sums = [start_latency]
+        iters = [iter(graph.get(start, ()))]
+
+        while iters:
+            neighbor = next(iters[-1], None)
+            if neighbor is None:
+                # Current branch exhausted: backtrack
+                iters.pop()
+                sums.pop()
+                visited.remove(nodes.pop())
+            elif neighbor not in visited:
+                total = sums[-1] + get_latency(neighbor, 0.0)
+                if total > best.get(neighbor, 0.0):
+                    best[neighbor] = total
+                visited.add(neighbor)
+                nodes.append(neighbor)
+                sums.append(total)
+                iters.append(iter(graph.get(neighbor, ())))
+
+        return best
+
     @staticmethod
-    def _build_graph(connections: List[Tuple[str, str]]) -> Dict[str, List[str]]:
+    def _build_csr(
+        connections: List[Tuple[int, int]],
+        num_nodes: int
+    ) -> Tuple[array, array]:
         """
-        Build a directed graph from connections.
-        
+        Build a Compressed Sparse Row view of the coded connection list.
+
         Args:
-            connections: List of connections between services (source_id, target_id)
-            
+            connections: List of (source, target) int-coded edges
+            num_nodes: Number of distinct nodes
+
         Returns:
-            Graph as an adjacency list
+            Tuple of (indptr, indices); neighbors of node v are
+            indices[indptr[v]:indptr[v + 1]]
         """
-        graph = {}
-        
+        out_degree = [0] * num_nodes
+        for source, _ in connections:
+            out_degree[source] += 1
+
+        indptr = array('i', [0] * (num_nodes + 1))
+        for node in range(num_nodes):
+            indptr[node + 1] = indptr[node] + out_degree[node]
+
+        indices = array('i', [0] * len(connections))
+        fill = list(indptr[:num_nodes])
+        for source, target in connections:
+            indices[fill[source]] = target
+            fill[source] += 1
+
+        return indptr, indices
+
+    @staticmethod
+    def _build_graph(
+        connections: List[Tuple[int, int]]
+    ) -> Tuple[Dict[int, List[int]], Dict[int, int]]:
+        """
+        Build a directed graph and its indegree map in one pass.
+
+        Args:
+            connections: List of int-coded (source, target) edges
+
+        Returns:
+            Tuple of (graph as an adjacency list, indegree per node)
+        """
+        graph: Dict[int, List[int]] = defaultdict(list)
+        indegrees: Dict[int, int] = defaultdict(int)
+
         for source, target in connections:
-            if source not in graph:
-                graph[source] = []
-            if target not in graph:
-                graph[target] = []
-            
             graph[source].append(target)
-        
-        return graph
+            graph[target]  # materialize sink nodes in the adjacency list
+            indegrees[target] += 1
+            indegrees.setdefault(source, 0)
+
+        return graph, indegrees
     
     @staticmethod
-    def _find_entry_points(graph: Dict[str, List[str]]) -> List[str]:
+    def _find_entry_points(graph: Dict[int, List[int]], indegrees: Dict[int, int]) -> List[int]:
         """
         Find entry points in the graph (nodes with no incoming edges).
-        
+
         Args:
-            graph: Graph as an adjacency list
-            
+            graph: Graph as an adjacency list over int-coded nodes
+            indegrees: Indegree per node, as built by _build_graph
+
         Returns:
-            List of entry point service IDs
+            List of entry point node codes
         """
-        # Find all nodes that are targets
-        targets = set()
-        for source, target_list in graph.items():
-            targets.update(target_list)
-        
-        # Entry points are nodes that are not targets
-        entry_points = [node for node in graph if node not in targets]
-        
+        # Entry points are nodes with no incoming edges
+        entry_points = [node for node, degree in indegrees.items() if degree == 0]
+
         # If no entry points found, use any node as entry point
         if not entry_points and graph:
             entry_points = [next(iter(graph))]
-        
+
         return entry_points
     
     @staticmethod
-    def _find_exit_points(graph: Dict[str, List[str]]) -> List[str]:
+    def _find_exit_points(graph: Dict[int, List[int]]) -> List[int]:
         """
         Find exit points in the graph (nodes with no outgoing edges).
-        
+
         Args:
-            graph: Graph as an adjacency list
-            
+            graph: Graph as an adjacency list over int-coded nodes
+
         Returns:
-            List of exit point service IDs
+            List of exit point node codes
         """
         exit_points = [node for node, targets in graph.items() if not targets]
         
         # If no exit points found, use any node as exit point
         if not exit_points and graph:
             exit_points = [next(iter(graph))]
-        
+
         return exit_points
-    
-    @classmethod
-    def _calculate_path_latency(
-        cls,
-        start: str,
-        end: str,
-        graph: Dict[str, List[str]],
-        service_latencies: Dict[str, float]
-    ) -> float:
-        """
-        Calculate the latency of a path from start to end.
-        
-        Args:
-            start: Starting service ID
-            end: Ending service ID
-            graph: Graph as an adjacency list
-            service_latencies: Dictionary of service latencies
-            
-        Returns:
-            Path latency in milliseconds
-        """
-        # Use DFS to find all paths
-        all_paths = []
-        cls._find_all_paths(start, end, graph, [], all_paths)
-        
-        if not all_paths:
-            return 0.0
-        
-        # Calculate latency for each path
-        path_latencies = []
-        for path in all_paths:
-            latency = sum(service_latencies.get(service_id, 0.0) for service_id in path)
-            path_latencies.append(latency)
-        
-        # Return the maximum latency
-        return max(path_latencies) if path_latencies else 0.0
-    
-    @classmethod
-    def _find_all_paths(
-        cls,
-        current: str,
-        end: str,
-        graph: Dict[str, List[str]],
-        path: List[str],
-        all_paths: List[List[str]]
-    ) -> None:
-        """
-        Find all paths from current to end using DFS.
-        
-        Args:
-            current: Current service ID
-            end: Target service ID
-            graph: Graph as an adjacency list
-            path: Current path
-            all_paths: List to store all found paths
-        """
-        # Add current node to path
-        path.append(current)
-        
-        # If we reached the end, add the path to all_paths
-        if current == end:
-            all_paths.append(path.copy())
-        else:
-            # Explore all neighbors
-            for neighbor in graph.get(current, []):
-                # Avoid cycles
-                if neighbor not in path:
-                    cls._find_all_paths(neighbor, end, graph, path, all_paths)
-        
-        # Remove current node from path
-        path.pop()
\ No newline at end of file
+
+
+@lru_cache(maxsize=256)
+def _latency_cached(
+    services: Tuple[str, ...],
+    connections: Tuple[Tuple[str, str], ...],
+    level_id: Optional[int]
+) -> float:
+    """
+    Memoized latency estimation over canonicalized (hashable) inputs.
+
+    Args:
+        services: Sorted tuple of service IDs in the architecture
+        connections: Sorted tuple of connections between services
+        level_id: Optional level ID
+
+    Returns:
+        Estimated latency in milliseconds
+    """
+    return PerformanceTest._estimate_latency_uncached(services, connections, level_id)
+
+
+def _critical_path_latency(indptr: array, indices: array, latencies: List[float]) -> float:
+    """
+    Longest-path DP kernel over a CSR-encoded graph.
+
+    Kahn's topological sort and the forward relaxation are fused into one
+    pass written entirely with scalar ops over flat arrays, so the hot loop
+    carries no container machinery (an AOT/JIT compiler could take it as-is;
+    this tree has no such dependency, so it runs as plain Python).
+
+    Args:
+        indptr: CSR row pointers; neighbors of v are indices[indptr[v]:indptr[v + 1]]
+        indices: CSR neighbor array
+        latencies: Per-node latency, indexed by node code
+
+    Returns:
+        Maximum end-to-end path latency, or -1.0 if the graph has a cycle
+    """
+    num_nodes = len(latencies)
+
+    indegree = [0] * num_nodes
+    for i in range(len(indices)):
+        indegree[indices[i]] += 1
+
+    # Preallocated order list with a head cursor stands in for a deque
+    order = [0] * num_nodes
+    count = 0
+    for node in range(num_nodes):
+        if indegree[node] == 0:
+            order[count] = node
+            count += 1
+
+    # dist[v] is the highest latency of any path ending at v; a node's
+    # distance is final by the time it leaves the queue, since every
+    # in-edge has relaxed it before its indegree reached zero
+    dist = list(latencies)
+    head = 0
+    while head < count:
+        node = order[head]
+        head += 1
+        node_dist = dist[node]
+        for i in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[i]
+            candidate = node_dist + latencies[neighbor]
+            if candidate > dist[neighbor]:
+                dist[neighbor] = candidate
+            indegree[neighbor] -= 1
+            if indegree[neighbor] == 0:
+                order[count] = neighbor
+                count += 1
+
+    if count != num_nodes:
+        return -1.0
+
+    max_dist = 0.0
+    for node in range(num_nodes):
+        if dist[node] > max_dist:
+            max_dist = dist[node]
+    return max_dist
\ No newline at end of file
@@ -1,12 +1,142 @@
 """
 Security audit module for evaluating architecture security.
 """
-from typing import Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+# Bit assignment for services and edges mentioned by audit rules. The rule
+# vocabulary is tiny, so each rule condition packs into an int bitmask and
+# matching becomes a handful of AND/compare ops on machine words.
+_SERVICE_BITS: Dict[str, int] = {}
+_EDGE_BITS: Dict[Tuple[str, str], int] = {}
+
+# Service groups behind the WAF and authentication requirements
+_HIGH_RISK = frozenset({"rds", "dynamodb", "lambda", "ec2"})
+_AUTH_REQ = frozenset({"rds", "dynamodb", "lambda", "ec2", "s3"})
+
+
+def _mask(bits, keys) -> int:
+    """Assign bits to any new keys and OR the keys' bits into one mask."""
+    mask = 0
+    for key in keys:
+        bit = bits.get(key)
+        if bit is None:
+            bit = bits[key] = 1 << len(bits)
+        mask |= bit
+    return mask
+
+
+@dataclass
+class _AuditRule:
+    """A single security rule, matched against bitmask-encoded architectures."""
+    message: str
+    required_services: FrozenSet[str] = frozenset()
+    any_required_services: FrozenSet[str] = frozenset()
+    forbidden_services: FrozenSet[str] = frozenset()
+    any_trigger_edges: FrozenSet[Tuple[str, str]] = frozenset()
+    absent_edges: FrozenSet[Tuple[str, str]] = frozenset()
+    min_level: Optional[int] = None      # numeric level must be >= this
+    allow_unleveled: bool = True         # rule also applies when level_id is None
+
+    def __post_init__(self) -> None:
+        # Precompile the declared sets into bitmasks once at import
+        self._required_mask = _mask(_SERVICE_BITS, self.required_services)
+        self._any_required_mask = _mask(_SERVICE_BITS, self.any_required_services)
+        self._forbidden_mask = _mask(_SERVICE_BITS, self.forbidden_services)
+        self._trigger_mask = _mask(_EDGE_BITS, self.any_trigger_edges)
+        self._absent_mask = _mask(_EDGE_BITS, self.absent_edges)
+
+    def fires(self, svc_mask: int, edge_mask: int, level_id: Optional[int]) -> bool:
+        """Check whether this rule raises an issue for the architecture."""
+        if level_id is None:
+            if not self.allow_unleveled:
+                return False
+        elif self.min_level is not None and level_id < self.min_level:
+            return False
+
+        required = self._required_mask
+        trigger = self._trigger_mask
+        return (
+            svc_mask & required == required
+            and (not self._any_required_mask or svc_mask & self._any_required_mask)
+            and not svc_mask & self._forbidden_mask
+            and (not trigger or edge_mask & trigger)
+            and not edge_mask & self._absent_mask
+        )
+
+
+# Simplified per-level rules for the beginner levels
+_SIMPLIFIED_RULES: Dict[int, Tuple[_AuditRule, ...]] = {
+    # Level 1 (Blog API): only check for IAM role with Lambda
+    1: (
+        _AuditRule(
+            "Lambda function without IAM role",
+            required_services=frozenset({"lambda"}),
+            forbidden_services=frozenset({"iam"}),
+        ),
+    ),
+    # Level 2 (Static Portfolio): check for CloudFront with S3
+    2: (
+        _AuditRule(
+            "S3 bucket is publicly accessible without CloudFront",
+            required_services=frozenset({"s3"}),
+            forbidden_services=frozenset({"cloudfront"}),
+            any_trigger_edges=frozenset({("api_gateway", "s3")}),
+        ),
+    ),
+}
+
+# Comprehensive rules for levels 3+ (and unleveled audits), in report order.
+# The S3/KMS check is a simplification since we don't have direct access to
+# available_services here, so it only applies when KMS is in play.
+_COMPREHENSIVE_RULES: Tuple[_AuditRule, ...] = (
+    _AuditRule(
+        "S3 bucket is not encrypted with KMS",
+        required_services=frozenset({"s3", "kms"}),
+        absent_edges=frozenset({("kms", "s3")}),
+        min_level=3,
+        allow_unleveled=False,
+    ),
+    _AuditRule(
+        "S3 bucket is publicly accessible without CloudFront",
+        required_services=frozenset({"s3"}),
+        forbidden_services=frozenset({"cloudfront"}),
+        any_trigger_edges=frozenset({("api_gateway", "s3"), ("internet_gateway", "s3")}),
+    ),
+    _AuditRule(
+        "Lambda function without IAM role",
+        required_services=frozenset({"lambda"}),
+        forbidden_services=frozenset({"iam"}),
+    ),
+    _AuditRule(
+        "RDS database is not encrypted",
+        required_services=frozenset({"rds", "kms"}),
+        absent_edges=frozenset({("kms", "rds")}),
+    ),
+    _AuditRule(
+        "RDS database is not in a VPC",
+        required_services=frozenset({"rds"}),
+        forbidden_services=frozenset({"vpc"}),
+    ),
+    _AuditRule(
+        "API Gateway without WAF protection",
+        required_services=frozenset({"api_gateway", "waf"}),
+        any_required_services=frozenset({"rds", "dynamodb", "lambda", "ec2"}),
+        absent_edges=frozenset({("waf", "api_gateway")}),
+    ),
+    _AuditRule(
+        "Architecture lacks authentication mechanism",
+        any_required_services=frozenset({"rds", "dynamodb", "lambda", "ec2", "s3"}),
+        forbidden_services=frozenset({"cognito", "iam"}),
+        min_level=3,
+    ),
+)
 
 
 class SecurityAudit:
     """Performs security audits on AWS architectures."""
-    
+
     @classmethod
     def audit_architecture(
         cls,
@@ -16,100 +146,89 @@ class SecurityAudit:
     ) -> List[str]:
         """
         Audit an architecture for security issues.
-        
+
         Args:
             services: List of service IDs in the architecture
             connections: List of connections between services (source_id, target_id)
             level_id: Optional level ID to apply level-specific rules
-            
+
         Returns:
             List of security issues found
         """
-        issues = []
-        
-        # Level 1-2 have simplified security requirements
-        if level_id in [1, 2]:
-            # For level 1 (Blog API), only check for IAM role with Lambda
-            if level_id == 1:
-                if "lambda" in services and "iam" not in services:
-                    issues.append("Lambda function without IAM role")
-            
-            # For level 2 (Static Portfolio), check for CloudFront with S3
-            elif level_id == 2:
-                if "s3" in services and "cloudfront" not in services:
-                    # Check if S3 is directly connected to API Gateway
-                    for source, target in connections:
-                        if source == "api_gateway" and target == "s3":
-                            issues.append("S3 bucket is publicly accessible without CloudFront")
-                            break
-            
-            return issues
-        
-        # For levels 3+, apply more comprehensive security checks
-        
-        # For levels 3+, only check for S3 encryption if KMS is in the required or optional services
-        # This is a simplification since we don't have direct access to available_services here
-        if level_id and level_id >= 3:
-            if "s3" in services and "kms" in services and not any(conn[0] == "kms" and conn[1] == "s3" for conn in connections):
-                issues.append("S3 bucket is not encrypted with KMS")
-        
-        # Check for public S3 buckets without CloudFront
-        if "s3" in services and "cloudfront" not in services:
-            # Check if S3 is directly connected to API Gateway or Internet Gateway
-            for source, target in connections:
-                if (source == "api_gateway" and target == "s3") or (source == "internet_gateway" and target == "s3"):
-                    issues.append("S3 bucket is publicly accessible without CloudFront")
-                    break
-        
-        # Check for Lambda functions without IAM roles
-        if "lambda" in services and "iam" not in services:
-            issues.append("Lambda function without IAM role")
-        
-        # Check for RDS without encryption (only if KMS is being used)
-        if "rds" in services and "kms" in services and not any(conn[0] == "kms" and conn[1] == "rds" for conn in connections):
-            issues.append("RDS database is not encrypted")
-        
-        # Check for RDS without VPC
-        if "rds" in services and "vpc" not in services:
-            issues.append("RDS database is not in a VPC")
-        
-        # Check for API Gateway without WAF (only if WAF is being used and level requires it)
-        if "api_gateway" in services and "waf" in services and cls._requires_waf(services) and not any(conn[0] == "waf" and conn[1] == "api_gateway" for conn in connections):
-            issues.append("API Gateway without WAF protection")
-        
-        # Check for missing authentication (only if authentication services are available)
-        auth_services = {"cognito", "iam"}.intersection(set(services))
-        if cls._requires_auth(services) and not auth_services and (level_id is None or level_id >= 3):
-            issues.append("Architecture lacks authentication mechanism")
-        
-        return issues
-    
+        # The audit is pure, so canonicalize to hashable keys and memoize;
+        # repeated audits of an unchanged architecture become a cache hit
+        return list(_audit_cached(frozenset(services), frozenset(connections), level_id))
+
     @staticmethod
     def _requires_waf(services: List[str]) -> bool:
         """
         Check if the architecture requires WAF based on services used.
-        
+
         Args:
             services: List of service IDs in the architecture
-            
+
         Returns:
             True if WAF is required, False otherwise
         """
-        # WAF is required for architectures with API Gateway and at least one of these services
-        high_risk_services = {"rds", "dynamodb", "lambda", "ec2"}
-        return "api_gateway" in services and any(service in high_risk_services for service in services)
-    
+        # WAF is required for architectures with API Gateway and at least
+        # one high-risk service; isdisjoint short-circuits in C
+        return "api_gateway" in services and not _HIGH_RISK.isdisjoint(services)
+
     @staticmethod
     def _requires_auth(services: List[str]) -> bool:
         """
         Check if the architecture requires authentication.
-        
+
         Args:
             services: List of service IDs in the architecture
-            
+
         Returns:
             True if authentication is required, False otherwise
         """
         # Authentication is required for architectures with these services
-        auth_required_services = {"rds", "dynamodb", "lambda", "ec2", "s3"}
-        return any(service in auth_required_services for service in services)
\ No newline at end of file
+        return not _AUTH_REQ.isdisjoint(services)
+
+
+@lru_cache(maxsize=256)
+def _audit_cached(
+    services: FrozenSet[str],
+    connections: FrozenSet[Tuple[str, str]],
+    level_id: Optional[int]
+) -> Tuple[str, ...]:
+    """
+    Memoized rule evaluation over canonicalized (hashable) inputs.
+
+    Args:
+        services: Frozenset of service IDs in the architecture
+        connections: Frozenset of connections between services
+        level_id: Optional level ID to apply level-specific rules
+
+    Returns:
+        Tuple of security issues found, in report order
+    """
+    # Pack the architecture into two bitmasks; services and edges no
+    # rule mentions carry no bit and drop out here
+    svc_bits = _SERVICE_BITS
+    svc_mask = 0
+    for service in services:
+        bit = svc_bits.get(service)
+        if bit:
+            svc_mask |= bit
+
+    edge_bits = _EDGE_BITS
+    edge_mask = 0
+    for connection in connections:
+        bit = edge_bits.get(connection)
+        if bit:
+            edge_mask |= bit
+
+    # Level 1-2 have simplified security requirements
+    if level_id in (1, 2):
+        rules = _SIMPLIFIED_RULES[level_id]
+    else:
+        rules = _COMPREHENSIVE_RULES
+
+    return tuple(
+        rule.message for rule in rules
+        if rule.fires(svc_mask, edge_mask, level_id)
+    )
@@ -1,16 +1,67 @@
 """
 Button UI component.
 """
+from functools import lru_cache
 from typing import Callable, Optional, Tuple
 
 import pygame
 
 from ui.aws_theme import AWSColors, AWSStyling
+from ui.fonts import get_font, render_text
+
+# Theme values used in the per-frame render path, bound once at module
+# level: a single global load replaces two attribute probes per frame
+_BORDER_RADIUS = AWSStyling.BORDER_RADIUS_MEDIUM
+_BORDER_COLOR = AWSColors.DARK_GRAY
+_BORDER_COLOR_DISABLED = AWSColors.MEDIUM_GRAY
+
+
+@lru_cache(maxsize=64)
+def _button_background(
+    size: Tuple[int, int],
+    color: Tuple[int, int, int],
+    border_color: Tuple[int, int, int]
+) -> pygame.Surface:
+    """
+    Render a button background and border to a shared reusable surface.
+
+    Buttons with the same size and colors (e.g. a column of menu entries)
+    all blit the same cached surface instead of each rasterizing two
+    rounded rects per frame.
+
+    Args:
+        size: Button size in pixels
+        color: Fill color for the background
+        border_color: Border color
+
+    Returns:
+        Surface with the rounded background and border drawn on it
+    """
+    background = pygame.Surface(size, pygame.SRCALPHA)
+    rect = background.get_rect()
+
+    # Draw rounded rectangle
+    border_radius = min(_BORDER_RADIUS, size[1] // 2)
+    pygame.draw.rect(background, color, rect, border_radius=border_radius)
+
+    # Draw border with slightly thicker line for better visibility
+    pygame.draw.rect(background, border_color, rect, 2, border_radius=border_radius)
+
+    # Match the display's pixel format for the fast blit path
+    return background.convert_alpha()
 
 
 class Button:
     """Interactive button UI component."""
-    
+
+    # Buttons are instantiated in bulk (one per level plus the fixed
+    # controls), so fixed slots replace the per-instance attribute dict
+    __slots__ = (
+        "rect", "text", "callback", "style", "disabled", "is_hovered",
+        "bg_color", "hover_color", "text_color", "font", "tooltip_target",
+        "_image", "_image_sig",
+    )
+
     def __init__(
         self,
         rect: pygame.Rect,
@@ -81,34 +132,44 @@ class Button:
             self.text_color = AWSColors.DARK_GRAY
         
         # Create font
-        self.font = pygame.font.SysFont(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_NORMAL)
-        self.text_surface = self.font.render(text, True, self.text_color)
-        self.text_rect = self.text_surface.get_rect(center=self.rect.center)
-    
+        self.font = get_font(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_NORMAL)
+
+        # Tooltip target key the owning manager reads on hover, if any
+        self.tooltip_target: Optional[str] = None
+
+        # Pre-composited background+text image, rebuilt only when the
+        # state it was composed from changes
+        self._image: Optional[pygame.Surface] = None
+        self._image_sig: Optional[Tuple] = None
+
+    @property
+    def image(self) -> pygame.Surface:
+        """
+        Composite of the button's current background, border and text.
+
+        Callers can blit this directly (e.g. batched through
+        Surface.blits); it recomposes only when the size, colors, hover
+        state or text actually change.
+        """
+        color = self.hover_color if self.is_hovered and not self.disabled else self.bg_color
+        border_color = _BORDER_COLOR if not self.disabled else _BORDER_COLOR_DISABLED
+        sig = (self.rect.size, color, border_color, self.text, self.text_color)
+        if sig != self._image_sig:
+            image = _button_background(self.rect.size, color, border_color).copy()
+            text_surface = render_text(self.font, self.text, self.text_color)
+            image.blit(text_surface, text_surface.get_rect(center=image.get_rect().center))
+            self._image = image
+            self._image_sig = sig
+        return self._image
+
     def render(self, surface: pygame.Surface) -> None:
         """
         Render the button.
-        
+
         Args:
             surface: Pygame surface to render on
         """
-        # Draw button background with rounded corners
-        color = self.hover_color if self.is_hovered and not self.disabled else self.bg_color
-        
-        # Draw rounded rectangle
-        border_radius = min(AWSStyling.BORDER_RADIUS_MEDIUM, self.rect.height // 2)
-        pygame.draw.rect(surface, color, self.rect, border_radius=border_radius)
-        
-        # Draw border with slightly thicker line for better visibility
-        border_color = AWSColors.DARK_GRAY if not self.disabled else AWSColors.MEDIUM_GRAY
-        pygame.draw.rect(surface, border_color, self.rect, 2, border_radius=border_radius)
-        
-        # Update text surface if text has changed
-        self.text_surface = self.font.render(self.text, True, self.text_color)
-        self.text_rect = self.text_surface.get_rect(center=self.rect.center)
-        
-        # Draw text
-        surface.blit(self.text_surface, self.text_rect)
+        surface.blit(self.image, self.rect.topleft)
     
     def on_click(self) -> None:
         """Handle button click."""
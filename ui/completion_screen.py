@@ -1,12 +1,14 @@
 """
 Level completion screen UI component.
 """
+from array import array
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import pygame
 
 from ui.aws_theme import AWSColors, AWSStyling
 from ui.button import Button
+from ui.fonts import get_font, render_text
 
 
 class CompletionScreen:
@@ -29,10 +31,10 @@ class CompletionScreen:
         self.active = True
         
         # Create fonts
-        self.title_font = pygame.font.SysFont(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_XXLARGE, bold=True)
-        self.heading_font = pygame.font.SysFont(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_XLARGE, bold=True)
-        self.text_font = pygame.font.SysFont(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_LARGE)
-        self.info_font = pygame.font.SysFont(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_MEDIUM)
+        self.title_font = get_font(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_XXLARGE, bold=True)
+        self.heading_font = get_font(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_XLARGE, bold=True)
+        self.text_font = get_font(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_LARGE)
+        self.info_font = get_font(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_MEDIUM)
         
         # Calculate layout
         self.window_width = self.game.config.window.width
@@ -47,8 +49,41 @@ class CompletionScreen:
         # Animation state
         self.animation_progress = 0.0  # 0.0 to 1.0
         self.animation_speed = 0.05  # Progress per frame
-        self.particles = []
         self._create_particles()
+
+        # Persistent background overlay: filled black once, faded per frame
+        # via set_alpha instead of reallocating a full-screen surface
+        self._overlay = pygame.Surface((self.window_width, self.window_height))
+        self._overlay.fill((0, 0, 0))
+
+        # Sprite caches for particle rendering: one base disk per
+        # (color, radius) plus alpha-modulated copies per brightness bucket
+        self._particle_bases: Dict[Tuple[Tuple[int, int, int], int], pygame.Surface] = {}
+        self._particle_sprites: Dict[Tuple[Tuple[int, int, int], int, int], pygame.Surface] = {}
+
+        # Pre-render the gradient panel once; the fade-in then costs one
+        # set_alpha + blit per frame instead of a per-scanline draw loop
+        self.panel_width = 600
+        self.panel_height = 400
+        self._panel_surf = self._build_gradient_panel(self.panel_width, self.panel_height)
+
+        # Pre-render the panel border at full alpha; the fade reuses it via
+        # set_alpha instead of stroking an RGBA rounded rect per frame
+        self._border_surf = pygame.Surface(
+            (self.panel_width, self.panel_height), pygame.SRCALPHA
+        )
+        pygame.draw.rect(
+            self._border_surf,
+            AWSColors.SMILE_ORANGE,
+            self._border_surf.get_rect(),
+            2,
+            border_radius=AWSStyling.BORDER_RADIUS_LARGE
+        )
+
+        # Once the intro animation finishes, every non-particle element is
+        # static; this holds them pre-composited so steady-state frames
+        # reduce to one blit plus particles and buttons
+        self._final_composite: Optional[pygame.Surface] = None
     
     def _create_buttons(self) -> None:
         """Create UI buttons for the completion screen."""
@@ -84,9 +119,9 @@ class CompletionScreen:
         self.next_button = next_button
     
     def _create_particles(self) -> None:
-        """Create celebration particles."""
+        """Create celebration particles in structure-of-arrays layout."""
         import random
-        
+
         # Create particles based on rank
         particle_count = 50
         if self.rank == "Gold":
@@ -96,18 +131,18 @@ class CompletionScreen:
             colors = [(192, 192, 192), (150, 150, 150)]
         else:  # Bronze
             colors = [(205, 127, 50), (160, 100, 40)]
-        
-        # Create particles
-        for _ in range(particle_count):
-            self.particles.append({
-                "x": self.window_width // 2,
-                "y": self.window_height // 2,
-                "vx": random.uniform(-5, 5),
-                "vy": random.uniform(-8, -2),
-                "radius": random.uniform(2, 6),
-                "color": random.choice(colors),
-                "life": random.uniform(0.5, 1.0)  # Life percentage (1.0 = full life)
-            })
+
+        # One flat column per field instead of a dict per particle, so the
+        # update loop indexes packed floats rather than hashing dict keys
+        cx = self.window_width // 2
+        cy = self.window_height // 2
+        self.particle_x = array('f', (cx for _ in range(particle_count)))
+        self.particle_y = array('f', (cy for _ in range(particle_count)))
+        self.particle_vx = array('f', (random.uniform(-5, 5) for _ in range(particle_count)))
+        self.particle_vy = array('f', (random.uniform(-8, -2) for _ in range(particle_count)))
+        self.particle_radius = array('f', (random.uniform(2, 6) for _ in range(particle_count)))
+        self.particle_life = array('f', (random.uniform(0.5, 1.0) for _ in range(particle_count)))
+        self.particle_colors = [random.choice(colors) for _ in range(particle_count)]
     
     def update(self) -> None:
         """Update the completion screen state."""
@@ -121,26 +156,30 @@ class CompletionScreen:
         if not self.next_level_available:
             self.next_button.disabled = True
         
-        # Update particles
+        # Update particles column-wise over the packed arrays
         import random
-        for particle in self.particles:
+        px, py = self.particle_x, self.particle_y
+        vx, vy = self.particle_vx, self.particle_vy
+        life = self.particle_life
+        for i in range(len(px)):
             # Apply gravity
-            particle["vy"] += 0.1
-            
+            vy[i] += 0.1
+
             # Update position
-            particle["x"] += particle["vx"]
-            particle["y"] += particle["vy"]
-            
+            px[i] += vx[i]
+            py[i] += vy[i]
+
             # Update life
-            particle["life"] -= 0.005
-            
-            # Respawn dead particles
-            if particle["life"] <= 0:
-                particle["x"] = self.window_width // 2
-                particle["y"] = self.window_height // 2
-                particle["vx"] = random.uniform(-5, 5)
-                particle["vy"] = random.uniform(-8, -2)
-                particle["life"] = random.uniform(0.5, 1.0)
+            life[i] -= 0.005
+
+            # Respawn dead particles; particles that fell below the window
+            # can never climb back, so recycle them right away too
+            if life[i] <= 0 or py[i] > self.window_height + 8:
+                px[i] = self.window_width // 2
+                py[i] = self.window_height // 2
+                vx[i] = random.uniform(-5, 5)
+                vy[i] = random.uniform(-8, -2)
+                life[i] = random.uniform(0.5, 1.0)
     
     def render(self, surface: pygame.Surface) -> None:
         """
@@ -149,126 +188,48 @@ class CompletionScreen:
         Args:
             surface: Pygame surface to render on
         """
-        # Draw background overlay with animation
-        overlay = pygame.Surface((self.window_width, self.window_height), pygame.SRCALPHA)
-        alpha = int(180 * self.animation_progress)
-        overlay.fill((0, 0, 0, alpha))  # Semi-transparent black
-        surface.blit(overlay, (0, 0))
+        # Steady state: the overlay, panel and text stopped changing when
+        # the animation completed, so blit one cached composite and only
+        # draw the still-moving particles and buttons per frame
+        if self.animation_progress >= 1.0:
+            if (self._final_composite is None
+                    or self._final_composite.get_size() != surface.get_size()):
+                self._final_composite = self._build_final_composite(surface.get_size())
+            surface.blit(self._final_composite, (0, 0))
+            self._render_particles(surface)
+            for button in self.buttons:
+                button.render(surface)
+            return
+
+        # Draw background overlay with animation, rebuilding the cached
+        # surface only if the window size changed
+        if self._overlay.get_size() != surface.get_size():
+            self._overlay = pygame.Surface(surface.get_size())
+            self._overlay.fill((0, 0, 0))
+        self._overlay.set_alpha(int(180 * self.animation_progress))
+        surface.blit(self._overlay, (0, 0))
         
         # Draw completion panel with animation
-        panel_width = 600
-        panel_height = 400
         panel_rect = pygame.Rect(
-            (self.window_width - panel_width) // 2,
-            (self.window_height - panel_height) // 2 - int(50 * (1 - self.animation_progress)),
-            panel_width,
-            panel_height
+            (self.window_width - self.panel_width) // 2,
+            (self.window_height - self.panel_height) // 2 - int(50 * (1 - self.animation_progress)),
+            self.panel_width,
+            self.panel_height
         )
         
         # Draw panel background with gradient
         self._draw_gradient_panel(surface, panel_rect)
         
-        # Draw particles
-        for particle in self.particles:
-            # Skip if not visible yet
-            if self.animation_progress < 0.8:
-                continue
-                
-            # Calculate alpha based on life
-            alpha = int(255 * particle["life"])
-            color_with_alpha = (*particle["color"], alpha)
-            
-            # Draw particle
-            pygame.draw.circle(
-                surface,
-                color_with_alpha,
-                (int(particle["x"]), int(particle["y"])),
-                int(particle["radius"])
-            )
-        
-        # Skip the rest if animation is not far enough
-        if self.animation_progress < 0.3:
-            return
-        
-        # Draw completion title with animation
-        title_alpha = int(min(255, 255 * (self.animation_progress - 0.3) / 0.2))
-        self._render_text_with_alpha(
-            surface,
-            "Level Complete!",
-            self.title_font,
-            AWSColors.SMILE_ORANGE,
-            self.window_width // 2,
-            panel_rect.top + 40,
-            title_alpha
-        )
-        
-        # Skip the rest if animation is not far enough
-        if self.animation_progress < 0.5:
-            return
-        
-        # Draw level info with animation
-        level_alpha = int(min(255, 255 * (self.animation_progress - 0.5) / 0.2))
-        self._render_text_with_alpha(
-            surface,
-            f"Level {self.level_id}",
-            self.heading_font,
-            AWSColors.WHITE,
-            self.window_width // 2,
-            panel_rect.top + 100,
-            level_alpha
-        )
-        
-        # Draw score with animation
-        score_alpha = int(min(255, 255 * (self.animation_progress - 0.6) / 0.2))
-        self._render_text_with_alpha(
-            surface,
-            f"Score: {self.score}",
-            self.text_font,
-            AWSColors.WHITE,
-            self.window_width // 2,
-            panel_rect.top + 150,
-            score_alpha
-        )
-        
-        # Draw rank with color based on rank and animation
-        rank_alpha = int(min(255, 255 * (self.animation_progress - 0.7) / 0.2))
-        rank_color = AWSColors.WHITE
-        if self.rank == "Gold":
-            rank_color = AWSColors.RIND
-        elif self.rank == "Silver":
-            rank_color = (192, 192, 192)  # Silver color
-        elif self.rank == "Bronze":
-            rank_color = (205, 127, 50)  # Bronze color
-            
-        self._render_text_with_alpha(
-            surface,
-            f"{self.rank} Architect",
-            self.heading_font,
-            rank_color,
-            self.window_width // 2,
-            panel_rect.top + 200,
-            rank_alpha
-        )
-        
-        # Draw congratulatory message with animation
-        message_alpha = int(min(255, 255 * (self.animation_progress - 0.8) / 0.2))
-        if self.rank == "Gold":
-            message = "Outstanding work! You've achieved the highest rank!"
-        elif self.rank == "Silver":
-            message = "Great job! Can you optimize further for Gold?"
-        else:
-            message = "Good start! Try optimizing your solution for a higher rank."
-            
-        self._render_text_with_alpha(
-            surface,
-            message,
-            self.info_font,
-            AWSColors.WHITE,
-            self.window_width // 2,
-            panel_rect.top + 250,
-            message_alpha
-        )
-        
+        # Draw particles once the animation has revealed them
+        if self.animation_progress >= 0.8:
+            self._render_particles(surface)
+
+        # Collect the staged text draws and hand them to SDL in one batched
+        # call; each stage fades in as the animation passes its threshold
+        text_blits = self._collect_text_blits(panel_rect)
+        if text_blits:
+            surface.blits(text_blits, doreturn=0)
+
         # Draw buttons with animation
         if self.animation_progress > 0.9:
             for button in self.buttons:
@@ -282,65 +243,250 @@ class CompletionScreen:
             surface: Pygame surface to render on
             rect: Rectangle defining the panel position and size
         """
-        # Create a surface for the gradient
-        panel = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
+        # Fade the cached panel in by modulating its surface alpha
+        self._panel_surf.set_alpha(int(220 * self.animation_progress))
+        surface.blit(self._panel_surf, rect.topleft)
         
+        # Fade the cached border the same way
+        self._border_surf.set_alpha(int(255 * self.animation_progress))
+        surface.blit(self._border_surf, rect.topleft)
+    
+    def _render_particles(self, surface: pygame.Surface) -> None:
+        """
+        Draw all on-screen particles in one batched blit.
+
+        Looks up the pre-rendered disk per (color, radius, alpha bucket)
+        and hands all positions to SDL in one Surface.blits call.
+
+        Args:
+            surface: Pygame surface to render on
+        """
+        get_sprite = self._get_particle_sprite
+        width, height = surface.get_size()
+        particle_blits = []
+        for x, y, radius, life, color in zip(
+            self.particle_x, self.particle_y, self.particle_radius,
+            self.particle_life, self.particle_colors
+        ):
+            r = int(radius)
+            # Reject particles gravity has carried off-screen before
+            # they reach SDL; the bounds test is far cheaper than a blit
+            if x < -r or x > width + r or y < -r or y > height + r:
+                continue
+            alpha_bucket = int(255 * life) >> 3
+            sprite = get_sprite(color, r, alpha_bucket)
+            particle_blits.append((sprite, (int(x) - r, int(y) - r)))
+        if particle_blits:
+            surface.blits(particle_blits, doreturn=0)
+
+    def _collect_text_blits(
+        self,
+        panel_rect: pygame.Rect
+    ) -> List[Tuple[pygame.Surface, pygame.Rect]]:
+        """
+        Build the text blit list for the current animation progress.
+
+        Args:
+            panel_rect: Rectangle the panel occupies this frame
+
+        Returns:
+            List of (surface, rect) pairs ready for Surface.blits
+        """
+        text_blits = []
+
+        if self.animation_progress >= 0.3:
+            # Completion title
+            title_alpha = int(min(255, 255 * (self.animation_progress - 0.3) / 0.2))
+            text_blits.append(self._text_with_alpha(
+                "Level Complete!",
+                self.title_font,
+                AWSColors.SMILE_ORANGE,
+                self.window_width // 2,
+                panel_rect.top + 40,
+                title_alpha
+            ))
+
+        if self.animation_progress >= 0.5:
+            # Level info
+            level_alpha = int(min(255, 255 * (self.animation_progress - 0.5) / 0.2))
+            text_blits.append(self._text_with_alpha(
+                f"Level {self.level_id}",
+                self.heading_font,
+                AWSColors.WHITE,
+                self.window_width // 2,
+                panel_rect.top + 100,
+                level_alpha
+            ))
+
+            # Score
+            score_alpha = int(min(255, 255 * (self.animation_progress - 0.6) / 0.2))
+            text_blits.append(self._text_with_alpha(
+                f"Score: {self.score}",
+                self.text_font,
+                AWSColors.WHITE,
+                self.window_width // 2,
+                panel_rect.top + 150,
+                score_alpha
+            ))
+
+            # Rank, colored by rank
+            rank_alpha = int(min(255, 255 * (self.animation_progress - 0.7) / 0.2))
+            rank_color = AWSColors.WHITE
+            if self.rank == "Gold":
+                rank_color = AWSColors.RIND
+            elif self.rank == "Silver":
+                rank_color = (192, 192, 192)  # Silver color
+            elif self.rank == "Bronze":
+                rank_color = (205, 127, 50)  # Bronze color
+
+            text_blits.append(self._text_with_alpha(
+                f"{self.rank} Architect",
+                self.heading_font,
+                rank_color,
+                self.window_width // 2,
+                panel_rect.top + 200,
+                rank_alpha
+            ))
+
+            # Congratulatory message
+            message_alpha = int(min(255, 255 * (self.animation_progress - 0.8) / 0.2))
+            if self.rank == "Gold":
+                message = "Outstanding work! You've achieved the highest rank!"
+            elif self.rank == "Silver":
+                message = "Great job! Can you optimize further for Gold?"
+            else:
+                message = "Good start! Try optimizing your solution for a higher rank."
+
+            text_blits.append(self._text_with_alpha(
+                message,
+                self.info_font,
+                AWSColors.WHITE,
+                self.window_width // 2,
+                panel_rect.top + 250,
+                message_alpha
+            ))
+
+        return text_blits
+
+    def _build_final_composite(self, size: Tuple[int, int]) -> pygame.Surface:
+        """
+        Pre-composite the static post-animation content into one surface.
+
+        At full animation progress the overlay, panel, border and text all
+        hold their final alphas, so they flatten into a single RGBA layer.
+        Particles and buttons stay out: particles keep moving and buttons
+        change with hover state.
+
+        Args:
+            size: Size of the destination surface
+
+        Returns:
+            Composite surface ready to blit as the frame's base layer
+        """
+        composite = pygame.Surface(size, pygame.SRCALPHA)
+        composite.fill((0, 0, 0, 180))
+
+        panel_rect = pygame.Rect(
+            (self.window_width - self.panel_width) // 2,
+            (self.window_height - self.panel_height) // 2,
+            self.panel_width,
+            self.panel_height
+        )
+        self._panel_surf.set_alpha(220)
+        composite.blit(self._panel_surf, panel_rect.topleft)
+        self._border_surf.set_alpha(255)
+        composite.blit(self._border_surf, panel_rect.topleft)
+
+        composite.blits(self._collect_text_blits(panel_rect), doreturn=0)
+        return composite
+
+    def _get_particle_sprite(
+        self,
+        color: Tuple[int, int, int],
+        radius: int,
+        alpha_bucket: int
+    ) -> pygame.Surface:
+        """
+        Get a pre-rendered particle disk for a color, radius and alpha bucket.
+
+        Alphas are quantized to 8-step buckets so the variant count stays
+        bounded while fading particles still dim smoothly.
+
+        Args:
+            color: Particle color (RGB)
+            radius: Particle radius in pixels
+            alpha_bucket: Quantized alpha (alpha >> 3)
+
+        Returns:
+            Cached sprite surface with the disk drawn and alpha applied
+        """
+        key = (color, radius, alpha_bucket)
+        sprite = self._particle_sprites.get(key)
+        if sprite is None:
+            base = self._particle_bases.get((color, radius))
+            if base is None:
+                size = radius * 2
+                base = pygame.Surface((size, size), pygame.SRCALPHA)
+                pygame.draw.circle(base, color, (radius, radius), radius)
+                self._particle_bases[(color, radius)] = base
+            sprite = base.copy()
+            sprite.set_alpha((alpha_bucket << 3) + 4)
+            self._particle_sprites[key] = sprite
+        return sprite
+
+    @staticmethod
+    def _build_gradient_panel(width: int, height: int) -> pygame.Surface:
+        """
+        Rasterize the panel's vertical gradient into a reusable surface.
+
+        Args:
+            width: Panel width in pixels
+            height: Panel height in pixels
+
+        Returns:
+            Surface with the gradient drawn at full opacity
+        """
         # Define gradient colors
         top_color = AWSColors.SQUID_INK
         bottom_color = (top_color[0] + 20, top_color[1] + 20, top_color[2] + 20)
-        
-        # Draw gradient
-        for y in range(rect.height):
-            # Calculate color for this line
-            ratio = y / rect.height
-            color = (
-                int(top_color[0] * (1 - ratio) + bottom_color[0] * ratio),
-                int(top_color[1] * (1 - ratio) + bottom_color[1] * ratio),
-                int(top_color[2] * (1 - ratio) + bottom_color[2] * ratio),
-                int(220 * self.animation_progress)  # Alpha based on animation
-            )
-            pygame.draw.line(panel, color, (0, y), (rect.width, y))
-        
-        # Draw the panel
-        surface.blit(panel, rect)
-        
-        # Draw border
-        border_alpha = int(255 * self.animation_progress)
-        border_color = (*AWSColors.SMILE_ORANGE, border_alpha)
-        pygame.draw.rect(
-            surface, 
-            border_color, 
-            rect, 
-            2, 
-            border_radius=AWSStyling.BORDER_RADIUS_LARGE
-        )
-    
-    def _render_text_with_alpha(
+
+        # Interpolate between the two stops in a single C call: smoothscale
+        # bilinearly blends a 1x2 two-stop surface across the full panel,
+        # replacing the per-scanline Python draw loop
+        gradient = pygame.Surface((1, 2))
+        gradient.set_at((0, 0), top_color)
+        gradient.set_at((0, 1), bottom_color)
+        return pygame.transform.smoothscale(gradient, (width, height))
+
+    def _text_with_alpha(
         self,
-        surface: pygame.Surface,
         text: str,
         font: pygame.font.Font,
         color: Tuple[int, int, int],
         x: int,
         y: int,
         alpha: int
-    ) -> None:
+    ) -> Tuple[pygame.Surface, pygame.Rect]:
         """
-        Render text with alpha transparency.
-        
+        Prepare a text surface with alpha transparency for batched blitting.
+
         Args:
-            surface: Pygame surface to render on
             text: Text to render
             font: Font to use
             color: Text color (RGB)
             x: X position (center)
             y: Y position (top)
             alpha: Alpha value (0-255)
+
+        Returns:
+            Tuple of (text surface, destination rect) for Surface.blits
         """
-        text_surface = font.render(text, True, color)
+        # The cached surface is shared, but every caller sets its alpha
+        # immediately before blitting, so the mutation is safe here
+        text_surface = render_text(font, text, color)
         text_surface.set_alpha(alpha)
         text_rect = text_surface.get_rect(centerx=x, top=y)
-        surface.blit(text_surface, text_rect)
+        return text_surface, text_rect
     
     def handle_mouse_down(self, event: pygame.event.Event) -> bool:
         """
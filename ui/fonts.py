@@ -0,0 +1,108 @@
+"""
+Shared font helpers for UI components.
+"""
+from functools import lru_cache
+from typing import List, Tuple
+
+import pygame
+
+
+@lru_cache(maxsize=64)
+def get_font(family: str, size: int, bold: bool = False) -> pygame.font.Font:
+    """
+    Get a shared font, opening each (family, size, bold) combination once.
+
+    SysFont re-resolves and re-parses the font file per call, so UI
+    components that want the same face share one Font object instead of
+    opening their own.
+
+    Args:
+        family: Font family name
+        size: Font size in points
+        bold: Whether to use the bold variant
+
+    Returns:
+        Cached pygame Font object
+    """
+    return pygame.font.SysFont(family, size, bold=bold)
+
+
+@lru_cache(maxsize=512)
+def render_text(
+    font: pygame.font.Font,
+    text: str,
+    color: Tuple[int, int, int]
+) -> pygame.Surface:
+    """
+    Render text to a surface, memoized on (font, text, color).
+
+    HUD and completion-screen strings change rarely relative to the frame
+    rate, so caching the rasterized surfaces drops the per-frame FreeType
+    work to the frames where a value actually ticks. The bounded cache
+    evicts stale volatile strings (timers, scores) on its own.
+
+    Args:
+        font: Font to render with (hashed by identity)
+        text: Text to render
+        color: Text color (RGB)
+
+    Returns:
+        Rendered text surface, shared across callers
+    """
+    # convert_alpha matches the display's pixel format so the per-frame
+    # blits take SDL's fast path instead of converting on the fly
+    return font.render(text, True, color).convert_alpha()
+
+
+@lru_cache(maxsize=256)
+def wrap_text(
+    font: pygame.font.Font,
+    text: str,
+    max_width: int
+) -> Tuple[str, ...]:
+    """
+    Wrap text to fit within a given width, memoized on its inputs.
+
+    Measures each word exactly once and keeps a running line width, so a
+    wrap costs O(words) font.size calls on the first request and a dict
+    lookup on every repeat — UI components tend to re-wrap the same few
+    strings whenever they redraw.
+
+    Args:
+        font: Font to measure with (hashed by identity)
+        text: Text to wrap
+        max_width: Maximum line width in pixels
+
+    Returns:
+        Tuple of wrapped text lines
+    """
+    words = text.split(' ')
+    space_width = font.size(' ')[0]
+    lines = []
+    current_line = []
+    current_width = 0
+
+    for word in words:
+        # Try adding the word to the current line
+        word_width = font.size(word)[0]
+        test_width = current_width + space_width + word_width if current_line else word_width
+
+        if test_width <= max_width:
+            # Word fits, add it to the current line
+            current_line.append(word)
+            current_width = test_width
+        else:
+            # Word doesn't fit, start a new line
+            if current_line:
+                lines.append(' '.join(current_line))
+                current_line = [word]
+                current_width = word_width
+            else:
+                # If the word is too long for a single line, force it
+                lines.append(word)
+
+    # Add the last line
+    if current_line:
+        lines.append(' '.join(current_line))
+
+    return tuple(lines)
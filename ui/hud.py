@@ -5,7 +5,11 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import pygame
 
+from core.state import GameMode
+from tests.cost_estimator import CostEstimator
+from tests.performance_test import PerformanceTest
 from ui.aws_theme import AWSColors, AWSStyling
+from ui.fonts import get_font, render_text
 
 
 class HUD:
@@ -27,20 +31,48 @@ class HUD:
         )
         
         # Create fonts
-        self.title_font = pygame.font.SysFont(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_MEDIUM, bold=True)
-        self.info_font = pygame.font.SysFont(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_NORMAL)
-        self.icon_font = pygame.font.SysFont(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_SMALL)
+        self.title_font = get_font(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_MEDIUM, bold=True)
+        self.info_font = get_font(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_NORMAL)
+        self.icon_font = get_font(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_SMALL)
         
         # Create metric icons
         self.score_icon = "🏆"
         self.budget_icon = "💰"
         self.latency_icon = "⚡"
         self.time_icon = "⏱️"
+
+        # The icon and label of each metric card never change, so render
+        # them once; per frame only the value string is looked up
+        self._card_statics: Dict[str, Tuple[pygame.Surface, pygame.Surface]] = {
+            label: (
+                render_text(self.icon_font, icon, AWSColors.WHITE),
+                render_text(self.info_font, label, AWSColors.MEDIUM_GRAY),
+            )
+            for icon, label in (
+                (self.score_icon, "Score"),
+                (self.budget_icon, "Budget"),
+                (self.latency_icon, "Latency"),
+                (self.time_icon, "Time"),
+            )
+        }
+
+        # Cost/latency estimates keyed by the architecture they were
+        # computed from; recomputed only when the architecture changes
+        self._metrics_sig: Optional[Tuple] = None
+        self._cached_cost = 0.0
+        self._cached_latency = 0.0
+
+        # Formatted label strings keyed by the values they were built from,
+        # so static frames skip the float formatting entirely
+        self._text_cache: Dict[str, Tuple[Tuple, str]] = {}
+
+        # The HUD never resizes, so rasterize the gradient background and
+        # its top border once; per-frame rendering is then a single blit
+        self._background = self._build_background(self.rect.width, self.rect.height)
     
     def update(self) -> None:
         """Update the HUD state."""
         # Update time remaining in time trial mode
-        from core.state import GameMode
         if self.game.state.mode == GameMode.TIME_TRIAL and self.game.state.time_remaining is not None:
             # Check if time has run out
             if self.game.state.time_remaining <= 0 and not self.game.time_manager.time_out:
@@ -62,43 +94,41 @@ class HUD:
             level = self.game.level_manager.current_level
             
             # Draw level title
-            title_text = self.title_font.render(
-                f"Level {level.level_id}: {level.title}",
-                True,
-                AWSColors.WHITE
-            )
-            title_shadow = self.title_font.render(
-                f"Level {level.level_id}: {level.title}",
-                True,
-                AWSColors.SQUID_INK
-            )
-            
-            # Draw shadow effect
-            surface.blit(title_shadow, (22, self.rect.top + 12))
-            surface.blit(title_text, (20, self.rect.top + 10))
-            
-            # Get metrics
-            from tests.cost_estimator import CostEstimator
-            from tests.performance_test import PerformanceTest
-            
-            estimated_cost = CostEstimator.estimate_monthly_cost(
-                self.game.state.placed_services,
-                self.game.state.connections,
-                level.level_id
-            )
-            
-            estimated_latency = PerformanceTest.estimate_latency(
-                self.game.state.placed_services,
-                self.game.state.connections,
-                level.level_id
+            title = self._cached_text(
+                "title", (level.level_id, level.title), "Level {0}: {1}"
             )
+            title_text = render_text(self.title_font, title, AWSColors.WHITE)
+            title_shadow = render_text(self.title_font, title, AWSColors.SQUID_INK)
+
+            # Collect every text blit and issue them in one batched call;
+            # the shadow goes first so the title draws over it
+            blit_list = [
+                (title_shadow, (22, self.rect.top + 12)),
+                (title_text, (20, self.rect.top + 10))
+            ]
+
+            # Get metrics, reusing the previous estimates while the
+            # architecture is unchanged
+            placed_services = self.game.state.placed_services
+            connections = self.game.state.connections
+            sig = (tuple(placed_services), tuple(connections), level.level_id)
+            if sig != self._metrics_sig:
+                self._cached_cost = CostEstimator.estimate_monthly_cost(
+                    placed_services, connections, level.level_id
+                )
+                self._cached_latency = PerformanceTest.estimate_latency(
+                    placed_services, connections, level.level_id
+                )
+                self._metrics_sig = sig
+
+            estimated_cost = self._cached_cost
+            estimated_latency = self._cached_latency
             
             # Create metric cards
             self._draw_metric_card(
-                surface, 
-                self.score_icon,
-                "Score", 
-                f"{self.game.state.score}", 
+                blit_list,
+                "Score",
+                self._cached_text("score", (self.game.state.score,), "{0}"),
                 20, 
                 self.rect.top + 45,
                 AWSColors.RIND
@@ -106,10 +136,11 @@ class HUD:
             
             budget_color = AWSColors.SUCCESS if estimated_cost <= level.budget else AWSColors.ERROR
             self._draw_metric_card(
-                surface, 
-                self.budget_icon,
-                "Budget", 
-                f"${estimated_cost:.2f} / ${level.budget:.2f}", 
+                blit_list,
+                "Budget",
+                self._cached_text(
+                    "budget", (estimated_cost, level.budget), "${0:.2f} / ${1:.2f}"
+                ),
                 200, 
                 self.rect.top + 45,
                 budget_color
@@ -117,83 +148,102 @@ class HUD:
             
             latency_color = AWSColors.SUCCESS if estimated_latency <= level.max_latency else AWSColors.ERROR
             self._draw_metric_card(
-                surface, 
-                self.latency_icon,
-                "Latency", 
-                f"{estimated_latency:.2f}ms / {level.max_latency:.2f}ms", 
+                blit_list,
+                "Latency",
+                self._cached_text(
+                    "latency", (estimated_latency, level.max_latency), "{0:.2f}ms / {1:.2f}ms"
+                ),
                 400, 
                 self.rect.top + 45,
                 latency_color
             )
             
             # Draw time remaining if in time trial mode
-            from core.state import GameMode
             if self.game.state.mode == GameMode.TIME_TRIAL and self.game.state.time_remaining is not None:
                 minutes = int(self.game.state.time_remaining // 60)
                 seconds = int(self.game.state.time_remaining % 60)
                 
                 time_color = AWSColors.SUCCESS if self.game.state.time_remaining > 30 else AWSColors.ERROR
                 self._draw_metric_card(
-                    surface, 
-                    self.time_icon,
-                    "Time", 
-                    f"{minutes:02d}:{seconds:02d}", 
+                    blit_list,
+                    "Time",
+                    self._cached_text("time", (minutes, seconds), "{0:02d}:{1:02d}"),
                     600, 
                     self.rect.top + 45,
                     time_color
                 )
-    
+
+            # One batched call hands the whole frame's text to SDL at once
+            surface.blits(blit_list, doreturn=0)
+
+    def _cached_text(self, name: str, values: Tuple, template: str) -> str:
+        """
+        Format a label string, reusing the last result while its values hold.
+
+        Args:
+            name: Stable identifier for the label (one slot per label)
+            values: Values the string is built from
+            template: str.format template applied to the values
+
+        Returns:
+            Formatted string, cached across frames with unchanged values
+        """
+        cached = self._text_cache.get(name)
+        if cached is not None and cached[0] == values:
+            return cached[1]
+
+        text = template.format(*values)
+        self._text_cache[name] = (values, text)
+        return text
+
     def _draw_gradient_background(self, surface: pygame.Surface) -> None:
-        """Draw a gradient background for the HUD."""
-        # Create a surface for the gradient
-        gradient = pygame.Surface((self.rect.width, self.rect.height))
-        
+        """Draw the pre-rendered gradient background for the HUD."""
+        surface.blit(self._background, self.rect)
+
+    @staticmethod
+    def _build_background(width: int, height: int) -> pygame.Surface:
+        """
+        Rasterize the HUD's gradient and top border into a reusable surface.
+
+        Args:
+            width: HUD width in pixels
+            height: HUD height in pixels
+
+        Returns:
+            Surface with the gradient and border drawn once
+        """
         # Define gradient colors
         top_color = AWSColors.SQUID_INK
         bottom_color = (top_color[0] + 15, top_color[1] + 15, top_color[2] + 15)
-        
-        # Draw gradient
-        for y in range(self.rect.height):
-            # Calculate color for this line
-            ratio = y / self.rect.height
-            color = (
-                int(top_color[0] * (1 - ratio) + bottom_color[0] * ratio),
-                int(top_color[1] * (1 - ratio) + bottom_color[1] * ratio),
-                int(top_color[2] * (1 - ratio) + bottom_color[2] * ratio)
-            )
-            pygame.draw.line(gradient, color, (0, y), (self.rect.width, y))
-        
-        # Draw the gradient surface
-        surface.blit(gradient, self.rect)
-        
+
+        # Interpolate between the two stops in a single C call: smoothscale
+        # bilinearly blends a 1x2 two-stop surface across the full HUD,
+        # replacing the per-frame per-scanline Python draw loop
+        gradient = pygame.Surface((1, 2))
+        gradient.set_at((0, 0), top_color)
+        gradient.set_at((0, 1), bottom_color)
+        background = pygame.transform.smoothscale(gradient, (width, height))
+
         # Draw top border
-        pygame.draw.line(
-            surface, 
-            AWSColors.SMILE_ORANGE, 
-            (0, self.rect.top), 
-            (self.rect.right, self.rect.top), 
-            2
-        )
+        pygame.draw.line(background, AWSColors.SMILE_ORANGE, (0, 0), (width, 0), 2)
+
+        return background
     
     def _draw_metric_card(
-        self, 
-        surface: pygame.Surface, 
-        icon: str,
-        label: str, 
-        value: str, 
-        x: int, 
+        self,
+        blit_list: List[Tuple[pygame.Surface, Tuple[int, int]]],
+        label: str,
+        value: str,
+        x: int,
         y: int,
         value_color: Tuple[int, int, int]
     ) -> None:
-        """Draw a metric card with icon, label and value."""
-        # Draw icon
-        icon_text = self.icon_font.render(icon, True, AWSColors.WHITE)
-        surface.blit(icon_text, (x, y))
-        
-        # Draw label
-        label_text = self.info_font.render(label, True, AWSColors.MEDIUM_GRAY)
-        surface.blit(label_text, (x + 25, y))
-        
-        # Draw value
-        value_text = self.info_font.render(value, True, value_color)
-        surface.blit(value_text, (x + 25, y + 20))
\ No newline at end of file
+        """Queue a metric card's icon, label and value onto the blit list."""
+        # Icon and label are pre-rendered; only the value can change
+        icon_text, label_text = self._card_statics[label]
+        blit_list.append((icon_text, (x, y)))
+        blit_list.append((label_text, (x + 25, y)))
+
+        # Value
+        value_text = render_text(self.info_font, value, value_color)
+        blit_list.append((value_text, (x + 25, y + 20)))
\ No newline at end of file
@@ -1,6 +1,9 @@
 """
 Main menu UI component.
 """
+import json
+import os
+from collections import namedtuple
 from typing import Any, Dict, List, Optional, Tuple
 
 import pygame
@@ -8,6 +11,37 @@ import pygame
 from core.state import GameState, GameMode
 from ui.aws_theme import AWSColors, AWSStyling
 from ui.button import Button
+from ui.fonts import get_font, render_text, wrap_text
+
+# One row per level, with required_services pre-joined into the display
+# string so the menu never re-joins the list while rendering
+LevelRow = namedtuple("LevelRow", ["id", "title", "description", "required_services"])
+
+# Level data is constant, so it loads from disk once and is shared by
+# every menu instance instead of being re-read on each menu open
+_LEVEL_DATA: Optional[Tuple[LevelRow, ...]] = None
+
+
+def _get_level_data() -> Tuple[LevelRow, ...]:
+    """Load the level definitions from config, once, lazily."""
+    global _LEVEL_DATA
+    if _LEVEL_DATA is None:
+        levels_file = os.path.join("config", "levels.json")
+        if os.path.exists(levels_file):
+            with open(levels_file, "r") as f:
+                raw = json.load(f)["levels"]
+            _LEVEL_DATA = tuple(
+                LevelRow(
+                    level["id"],
+                    level["title"],
+                    level["description"],
+                    ", ".join(level["required_services"])
+                )
+                for level in raw
+            )
+        else:
+            _LEVEL_DATA = ()
+    return _LEVEL_DATA
 
 
 class MainMenu:
@@ -31,12 +65,13 @@ class MainMenu:
         self.tutorial_mode = False
         self.time_trial_mode = False
         
-        # Create fonts
-        self.title_font = pygame.font.SysFont(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_XXLARGE, bold=True)
-        self.heading_font = pygame.font.SysFont(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_XLARGE, bold=True)
-        self.text_font = pygame.font.SysFont(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_MEDIUM)
-        self.level_font = pygame.font.SysFont(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_LARGE, bold=True)
-        self.info_font = pygame.font.SysFont(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_NORMAL)
+        # Create fonts through the shared registry so each face is opened
+        # once and its glyph cache is shared across UI components
+        self.title_font = get_font(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_XXLARGE, bold=True)
+        self.heading_font = get_font(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_XLARGE, bold=True)
+        self.text_font = get_font(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_MEDIUM)
+        self.level_font = get_font(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_LARGE, bold=True)
+        self.info_font = get_font(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_NORMAL)
         
         # Calculate layout
         self.window_width = self.game.config.window.width
@@ -45,15 +80,48 @@ class MainMenu:
         # Animation state
         self.animation_progress = 0.0
         self.animation_speed = 0.05
+
+        # Menu state the per-frame button updates were computed from;
+        # update() skips the whole block while this is unchanged
+        self._button_state_sig: Optional[Tuple] = None
+
+        # Wrapped-and-rendered description lines keyed by (level, width);
+        # wrapping re-measures every word prefix, so do it once per level
+        self._wrap_cache: Dict[Tuple[int, int], List[pygame.Surface]] = {}
+
+        # The level-info panels are static for a given selection and
+        # completion state, so they composite into one surface that is
+        # rebuilt only when the key changes and blitted per frame
+        self._info_panel_surf: Optional[pygame.Surface] = None
+        self._info_panel_key: Optional[Tuple] = None
         
         # Create buttons
         self._create_buttons()
-        
+
+        # Button the mouse is currently over, so motion events inside the
+        # same button skip re-testing every rect
+        self._hovered: Optional[Button] = None
+
         # Load level data
         self._load_level_data()
         
         # Create AWS logo
         self.aws_logo = self._create_aws_logo()
+
+        # The logo, title and heading never move, so their destination
+        # rects are computed once instead of reallocated every frame
+        self._logo_rect = self.aws_logo.get_rect(topleft=(20, 20))
+        self._title_rect = render_text(
+            self.title_font, "Solutions Architect Simulator", AWSColors.WHITE
+        ).get_rect(centerx=self.window_width // 2, top=30)
+        self._heading_rect = render_text(
+            self.heading_font, "Select Level", AWSColors.WHITE
+        ).get_rect(centerx=self.window_width // 2, top=120)
+        self._info_panel_pos = (self.window_width // 2 - 300, self.window_height - 340)
+
+        # The window never resizes, so rasterize the gradient and grid
+        # pattern once; per-frame background rendering is then one blit
+        self._bg_cache = self._build_background(self.window_width, self.window_height)
     
     def _create_aws_logo(self) -> pygame.Surface:
         """Create a simple AWS logo."""
@@ -62,7 +130,7 @@ class MainMenu:
         logo = pygame.Surface((logo_width, logo_height), pygame.SRCALPHA)
         
         # Draw "AWS" text
-        font = pygame.font.SysFont(AWSStyling.FONT_FAMILY, 36, bold=True)
+        font = get_font(AWSStyling.FONT_FAMILY, 36, bold=True)
         text = font.render("AWS", True, AWSColors.WHITE)
         text_rect = text.get_rect(center=(logo_width // 2, logo_height // 2))
         
@@ -121,14 +189,24 @@ class MainMenu:
         )
         self.buttons.append(time_trial_button)
         self.time_trial_button = time_trial_button
-        
+
+        # The three buttons above sit outside the level grid, so click
+        # handling scans them only after the O(1) grid lookup misses
+        self.fixed_buttons = [start_button, tutorial_button, time_trial_button]
+
         # Level selection buttons
         level_button_width = 80
         level_button_height = 80
         levels_per_row = 5
         start_x = (self.window_width - (level_button_width * levels_per_row + 20 * (levels_per_row - 1))) // 2
         start_y = 180
-        
+
+        # Grid geometry for computing the clicked cell directly from a
+        # mouse position instead of scanning every button
+        self._grid_origin = (start_x, start_y)
+        self._grid_stride = (level_button_width + 20, level_button_height + 20)
+        self._grid_cols = levels_per_row
+
         self.level_buttons = []
         for i in range(1, 11):  # 10 levels
             row = (i - 1) // levels_per_row
@@ -166,15 +244,7 @@ class MainMenu:
     
     def _load_level_data(self) -> None:
         """Load level data from configuration."""
-        import json
-        import os
-        
-        levels_file = os.path.join("config", "levels.json")
-        if os.path.exists(levels_file):
-            with open(levels_file, "r") as f:
-                self.level_data = json.load(f)["levels"]
-        else:
-            self.level_data = []
+        self.level_data = _get_level_data()
     
     def update(self) -> None:
         """Update the main menu state."""
@@ -184,6 +254,20 @@ class MainMenu:
             if self.animation_progress > 1.0:
                 self.animation_progress = 1.0
         
+        # Skip the button restyling and text re-rendering below while the
+        # state it derives from is unchanged, which is every frame except
+        # the one where a selection or toggle actually flips
+        sig = (
+            self.selected_level,
+            self.tutorial_mode,
+            self.time_trial_mode,
+            frozenset(self.game.state.unlocked_levels),
+            frozenset(self.game.state.completed_levels),
+        )
+        if sig == self._button_state_sig:
+            return
+        self._button_state_sig = sig
+
         # Update button states based on unlocked levels
         for i, button in enumerate(self.level_buttons):
             level_id = i + 1
@@ -233,22 +317,7 @@ class MainMenu:
             self.time_trial_button.text = "Time Trial: OFF"
             self.time_trial_button.bg_color = AWSColors.BUTTON_SECONDARY
             self.time_trial_button.hover_color = AWSColors.BUTTON_SECONDARY_HOVER
-            
-        # Update text surfaces for both buttons to prevent text overlap
-        self.tutorial_button.text_surface = self.tutorial_button.font.render(
-            self.tutorial_button.text, True, self.tutorial_button.text_color
-        )
-        self.tutorial_button.text_rect = self.tutorial_button.text_surface.get_rect(
-            center=self.tutorial_button.rect.center
-        )
-        
-        self.time_trial_button.text_surface = self.time_trial_button.font.render(
-            self.time_trial_button.text, True, self.time_trial_button.text_color
-        )
-        self.time_trial_button.text_rect = self.time_trial_button.text_surface.get_rect(
-            center=self.time_trial_button.rect.center
-        )
-    
+
     def render(self, surface: pygame.Surface) -> None:
         """
         Render the main menu.
@@ -256,161 +325,99 @@ class MainMenu:
         Args:
             surface: Pygame surface to render on
         """
+        # Nothing to draw once the menu has been dismissed
+        if not self.active:
+            return
+
         # Draw background gradient
         self._draw_background(surface)
         
+        # Panels and badges draw immediately (they sit under the text);
+        # every text surface is collected here and handed to SDL in one
+        # batched call at the end of the frame
+        text_blits = []
+
         # Draw AWS logo
-        logo_rect = self.aws_logo.get_rect(topleft=(20, 20))
-        surface.blit(self.aws_logo, logo_rect)
-        
-        # Draw title with animation
+        text_blits.append((self.aws_logo, self._logo_rect))
+
+        # Draw title with animation; the surface comes from the shared
+        # text cache and only its alpha is touched per frame
         title_alpha = int(min(255, 255 * self.animation_progress / 0.3))
-        title_text = self.title_font.render("Solutions Architect Simulator", True, AWSColors.WHITE)
+        title_text = render_text(self.title_font, "Solutions Architect Simulator", AWSColors.WHITE)
         title_text.set_alpha(title_alpha)
-        title_rect = title_text.get_rect(centerx=self.window_width // 2, top=30)
-        surface.blit(title_text, title_rect)
-        
+        text_blits.append((title_text, self._title_rect))
+
         # Draw level selection heading with animation
         if self.animation_progress > 0.2:
             heading_alpha = int(min(255, 255 * (self.animation_progress - 0.2) / 0.3))
-            heading_text = self.heading_font.render("Select Level", True, AWSColors.WHITE)
+            heading_text = render_text(self.heading_font, "Select Level", AWSColors.WHITE)
             heading_text.set_alpha(heading_alpha)
-            heading_rect = heading_text.get_rect(centerx=self.window_width // 2, top=120)
-            surface.blit(heading_text, heading_rect)
+            text_blits.append((heading_text, self._heading_rect))
         
-        # Draw buttons with animation
+        # Draw buttons with animation, handing every pre-composited button
+        # image to SDL in one batched call
         if self.animation_progress > 0.3:
-            for button in self.buttons:
-                button.render(surface)
+            surface.blits(
+                [(button.image, button.rect) for button in self.buttons],
+                doreturn=0
+            )
         
-        # Draw selected level info with animation
+        # Draw selected level info with animation; the panels, text and
+        # badge composite into one cached surface per selection state
         if self.animation_progress > 0.5 and self.selected_level and 1 <= self.selected_level <= len(self.level_data):
-            level_info = self.level_data[self.selected_level - 1]
-            
-            # Create a panel for level info
-            panel_rect = pygame.Rect(
-                self.window_width // 2 - 300,
-                self.window_height - 340,
-                600,
-                120
-            )
-            self._draw_panel(surface, panel_rect)
-            
-            # Draw level title
-            level_title_text = self.level_font.render(
-                f"Level {level_info['id']}: {level_info['title']}",
-                True,
-                AWSColors.WHITE
-            )
-            level_title_rect = level_title_text.get_rect(
-                centerx=self.window_width // 2,
-                top=panel_rect.top + 10
-            )
-            surface.blit(level_title_text, level_title_rect)
-            
-            # Draw level description
-            description_lines = self._wrap_text(
-                level_info["description"],
-                self.info_font,
-                panel_rect.width - 40
-            )
-            y = level_title_rect.bottom + 10
-            for line in description_lines:
-                line_text = self.info_font.render(line, True, AWSColors.LIGHT_GRAY)
-                line_rect = line_text.get_rect(centerx=self.window_width // 2, top=y)
-                surface.blit(line_text, line_rect)
-                y += line_rect.height + 5
-            
-            # Draw required services in a separate panel
-            services_panel_rect = pygame.Rect(
-                self.window_width // 2 - 300,
-                panel_rect.bottom + 10,
-                600,
-                60
-            )
-            # Ensure services panel doesn't overlap with mode buttons
-            if services_panel_rect.bottom > self.window_height - 190:
-                services_panel_rect.y = self.window_height - 240
-            self._draw_panel(surface, services_panel_rect)
-            
-            # Draw required services
-            required_services = ", ".join(level_info["required_services"])
-            req_label = self.info_font.render("Required Services:", True, AWSColors.SMILE_ORANGE)
-            req_label_rect = req_label.get_rect(
-                left=services_panel_rect.left + 20,
-                top=services_panel_rect.top + 10
-            )
-            surface.blit(req_label, req_label_rect)
-            
-            req_text = self.info_font.render(required_services, True, AWSColors.WHITE)
-            req_rect = req_text.get_rect(
-                left=services_panel_rect.left + 20,
-                top=req_label_rect.bottom + 5
+            key = (
+                self.selected_level,
+                self.game.state.completed_levels.get(self.selected_level)
             )
-            surface.blit(req_text, req_rect)
-            
-            # Draw completion status if completed
-            if self.selected_level in self.game.state.completed_levels:
-                score = self.game.state.completed_levels[self.selected_level]
-                rank = self.game.state.get_rank_for_score(score)
-                
-                # Determine rank color
-                rank_color = AWSColors.RIND  # Default gold
-                if rank == "Silver":
-                    rank_color = (192, 192, 192)  # Silver
-                elif rank == "Bronze":
-                    rank_color = (205, 127, 50)  # Bronze
-                
-                # Create completion badge
-                badge_rect = pygame.Rect(
-                    services_panel_rect.right - 150,
-                    services_panel_rect.top + 10,
-                    130,
-                    40
-                )
-                pygame.draw.rect(surface, rank_color, badge_rect, border_radius=10)
-                pygame.draw.rect(surface, AWSColors.WHITE, badge_rect, 2, border_radius=10)
-                
-                # Draw rank text
-                rank_text = self.info_font.render(f"{rank} Architect", True, AWSColors.SQUID_INK)
-                rank_rect = rank_text.get_rect(center=badge_rect.center)
-                surface.blit(rank_text, rank_rect)
-                
-                # Draw score
-                score_text = self.info_font.render(f"Score: {score}", True, AWSColors.WHITE)
-                score_rect = score_text.get_rect(
-                    right=badge_rect.left - 10,
-                    centery=badge_rect.centery
+            if key != self._info_panel_key:
+                self._info_panel_surf = self._build_level_info_panel(
+                    self.level_data[self.selected_level - 1]
                 )
-                surface.blit(score_text, score_rect)
+                self._info_panel_key = key
+            text_blits.append((self._info_panel_surf, self._info_panel_pos))
+
+        # One batched call hands the whole frame's text to SDL at once
+        surface.blits(text_blits, doreturn=0)
     
     def _draw_background(self, surface: pygame.Surface) -> None:
-        """Draw a gradient background."""
-        # Create gradient from top to bottom
-        for y in range(self.window_height):
-            # Calculate color for this line
-            ratio = y / self.window_height
-            
-            # Gradient from dark blue to slightly lighter blue
-            color = (
-                int(AWSColors.SQUID_INK[0] * (1 - ratio) + (AWSColors.SQUID_INK[0] + 15) * ratio),
-                int(AWSColors.SQUID_INK[1] * (1 - ratio) + (AWSColors.SQUID_INK[1] + 15) * ratio),
-                int(AWSColors.SQUID_INK[2] * (1 - ratio) + (AWSColors.SQUID_INK[2] + 15) * ratio)
-            )
-            
-            pygame.draw.line(surface, color, (0, y), (self.window_width, y))
-        
+        """Draw the pre-rendered gradient and grid background."""
+        surface.blit(self._bg_cache, (0, 0))
+
+    @staticmethod
+    def _build_background(width: int, height: int) -> pygame.Surface:
+        """
+        Rasterize the menu's gradient and grid pattern into one surface.
+
+        Args:
+            width: Window width in pixels
+            height: Window height in pixels
+
+        Returns:
+            Surface with the gradient and grid drawn once
+        """
+        # Gradient from dark blue to slightly lighter blue, interpolated in
+        # a single C call by smoothscaling a 1x2 two-stop surface instead
+        # of drawing one scanline per row in Python
+        top_color = AWSColors.SQUID_INK
+        bottom_color = (top_color[0] + 15, top_color[1] + 15, top_color[2] + 15)
+        gradient = pygame.Surface((1, 2))
+        gradient.set_at((0, 0), top_color)
+        gradient.set_at((0, 1), bottom_color)
+        background = pygame.transform.smoothscale(gradient, (width, height))
+
         # Draw subtle grid pattern
-        grid_color = (AWSColors.SQUID_INK[0] + 8, AWSColors.SQUID_INK[1] + 8, AWSColors.SQUID_INK[2] + 8)
+        grid_color = (top_color[0] + 8, top_color[1] + 8, top_color[2] + 8)
         grid_spacing = 30
-        
+
         # Draw horizontal grid lines
-        for y in range(0, self.window_height, grid_spacing):
-            pygame.draw.line(surface, grid_color, (0, y), (self.window_width, y), 1)
-        
+        for y in range(0, height, grid_spacing):
+            pygame.draw.line(background, grid_color, (0, y), (width, y), 1)
+
         # Draw vertical grid lines
-        for x in range(0, self.window_width, grid_spacing):
-            pygame.draw.line(surface, grid_color, (x, 0), (x, self.window_height), 1)
+        for x in range(0, width, grid_spacing):
+            pygame.draw.line(background, grid_color, (x, 0), (x, height), 1)
+
+        return background
     
     def _draw_panel(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
         """Draw a semi-transparent panel with rounded corners."""
@@ -437,6 +444,121 @@ class MainMenu:
         # Blit panel to surface
         surface.blit(panel, rect)
     
+    def _build_level_info_panel(self, level_info: LevelRow) -> pygame.Surface:
+        """
+        Composite the selected level's info panels into one surface.
+
+        Everything here (panels, title, description, required services,
+        rank badge and score) only changes when the selection or its
+        completion state changes, so it renders once per state instead of
+        once per frame.
+
+        Args:
+            level_info: Level data for the selected level
+
+        Returns:
+            Composite surface positioned at the info panel's top-left
+        """
+        # Global geometry, translated to the composite's local origin
+        origin_x = self.window_width // 2 - 300
+        origin_y = self.window_height - 340
+        panel_rect = pygame.Rect(0, 0, 600, 120)
+
+        services_panel_rect = pygame.Rect(0, panel_rect.bottom + 10, 600, 60)
+        # Ensure services panel doesn't overlap with mode buttons
+        if origin_y + services_panel_rect.bottom > self.window_height - 190:
+            services_panel_rect.y = self.window_height - 240 - origin_y
+
+        composite = pygame.Surface(
+            (600, max(panel_rect.bottom, services_panel_rect.bottom)),
+            pygame.SRCALPHA
+        )
+        self._draw_panel(composite, panel_rect)
+
+        # Draw level title
+        level_title_text = self.level_font.render(
+            f"Level {level_info.id}: {level_info.title}",
+            True,
+            AWSColors.WHITE
+        )
+        level_title_rect = level_title_text.get_rect(
+            centerx=panel_rect.centerx,
+            top=panel_rect.top + 10
+        )
+        composite.blit(level_title_text, level_title_rect)
+
+        # Draw level description, wrapping and rendering the lines only
+        # the first time this level is shown at this width
+        wrap_key = (self.selected_level, panel_rect.width - 40)
+        description_lines = self._wrap_cache.get(wrap_key)
+        if description_lines is None:
+            description_lines = [
+                self.info_font.render(line, True, AWSColors.LIGHT_GRAY)
+                for line in self._wrap_text(
+                    level_info.description, self.info_font, wrap_key[1]
+                )
+            ]
+            self._wrap_cache[wrap_key] = description_lines
+        y = level_title_rect.bottom + 10
+        for line_text in description_lines:
+            line_rect = line_text.get_rect(centerx=panel_rect.centerx, top=y)
+            composite.blit(line_text, line_rect)
+            y += line_rect.height + 5
+
+        # Draw required services in a separate panel
+        self._draw_panel(composite, services_panel_rect)
+
+        req_label = self.info_font.render("Required Services:", True, AWSColors.SMILE_ORANGE)
+        req_label_rect = req_label.get_rect(
+            left=services_panel_rect.left + 20,
+            top=services_panel_rect.top + 10
+        )
+        composite.blit(req_label, req_label_rect)
+
+        req_text = self.info_font.render(level_info.required_services, True, AWSColors.WHITE)
+        req_rect = req_text.get_rect(
+            left=services_panel_rect.left + 20,
+            top=req_label_rect.bottom + 5
+        )
+        composite.blit(req_text, req_rect)
+
+        # Draw completion status if completed
+        if self.selected_level in self.game.state.completed_levels:
+            score = self.game.state.completed_levels[self.selected_level]
+            rank = self.game.state.get_rank_for_score(score)
+
+            # Determine rank color
+            rank_color = AWSColors.RIND  # Default gold
+            if rank == "Silver":
+                rank_color = (192, 192, 192)  # Silver
+            elif rank == "Bronze":
+                rank_color = (205, 127, 50)  # Bronze
+
+            # Create completion badge
+            badge_rect = pygame.Rect(
+                services_panel_rect.right - 150,
+                services_panel_rect.top + 10,
+                130,
+                40
+            )
+            pygame.draw.rect(composite, rank_color, badge_rect, border_radius=10)
+            pygame.draw.rect(composite, AWSColors.WHITE, badge_rect, 2, border_radius=10)
+
+            # Draw rank text
+            rank_text = self.info_font.render(f"{rank} Architect", True, AWSColors.SQUID_INK)
+            rank_rect = rank_text.get_rect(center=badge_rect.center)
+            composite.blit(rank_text, rank_rect)
+
+            # Draw score
+            score_text = self.info_font.render(f"Score: {score}", True, AWSColors.WHITE)
+            score_rect = score_text.get_rect(
+                right=badge_rect.left - 10,
+                centery=badge_rect.centery
+            )
+            composite.blit(score_text, score_rect)
+
+        return composite
+
     def handle_mouse_down(self, event: pygame.event.Event) -> bool:
         """
         Handle mouse button down events.
@@ -450,15 +572,42 @@ class MainMenu:
         # Only handle events if animation is complete
         if self.animation_progress < 0.5:
             return False
-            
-        # Check button clicks
-        for button in self.buttons:
-            if button.rect.collidepoint(event.pos):
-                button.on_click()
-                return True
-        
+
+        button = self._button_at(event.pos)
+        if button is not None:
+            button.on_click()
+            return True
+
         return False
-    
+
+    def _button_at(self, pos: Tuple[int, int]) -> Optional[Button]:
+        """
+        Find the button under the given position, if any.
+
+        The level buttons form a regular grid, so the candidate cell
+        follows from arithmetic; only a hit inside the cell's gutter
+        falls through to the handful of non-grid buttons.
+
+        Args:
+            pos: Position (x, y) to test
+
+        Returns:
+            The button at the position, or None
+        """
+        col = (pos[0] - self._grid_origin[0]) // self._grid_stride[0]
+        row = (pos[1] - self._grid_origin[1]) // self._grid_stride[1]
+        rows = len(self.level_buttons) // self._grid_cols
+        if 0 <= col < self._grid_cols and 0 <= row < rows:
+            button = self.level_buttons[row * self._grid_cols + col]
+            if button.rect.collidepoint(pos):
+                return button
+
+        for button in self.fixed_buttons:
+            if button.rect.collidepoint(pos):
+                return button
+
+        return None
+
     def handle_mouse_up(self, event: pygame.event.Event) -> bool:
         """
         Handle mouse button up events.
@@ -479,10 +628,19 @@ class MainMenu:
         Args:
             event: Pygame mouse motion event
         """
-        # Update button hover states
-        for button in self.buttons:
-            button.is_hovered = button.rect.collidepoint(event.pos)
-    
+        # Fast path: still inside the same button, nothing changes
+        if self._hovered is not None and self._hovered.rect.collidepoint(event.pos):
+            return
+
+        # Hover state changed: resolve the newly-hovered button through
+        # the grid lookup and clear only the old one
+        previous = self._hovered
+        self._hovered = self._button_at(event.pos)
+        if self._hovered is not None:
+            self._hovered.is_hovered = True
+        if previous is not None:
+            previous.is_hovered = False
+
     def _on_level_click(self, level_id: int) -> None:
         """
         Handle click on a level button.
@@ -560,22 +718,7 @@ class MainMenu:
                 self.tutorial_button.text = "Tutorial Mode: OFF"
                 self.tutorial_button.bg_color = AWSColors.BUTTON_SECONDARY
                 self.tutorial_button.hover_color = AWSColors.BUTTON_SECONDARY_HOVER
-                
-            # Update text surfaces immediately to prevent text overlap
-            self.tutorial_button.text_surface = self.tutorial_button.font.render(
-                self.tutorial_button.text, True, self.tutorial_button.text_color
-            )
-            self.tutorial_button.text_rect = self.tutorial_button.text_surface.get_rect(
-                center=self.tutorial_button.rect.center
-            )
-            
-            self.time_trial_button.text_surface = self.time_trial_button.font.render(
-                self.time_trial_button.text, True, self.time_trial_button.text_color
-            )
-            self.time_trial_button.text_rect = self.time_trial_button.text_surface.get_rect(
-                center=self.time_trial_button.rect.center
-            )
-    
+
     def _on_time_trial_click(self) -> None:
         """Handle click on the time trial mode button."""
         self.time_trial_mode = not self.time_trial_mode
@@ -601,22 +744,7 @@ class MainMenu:
             self.time_trial_button.text = "Time Trial: OFF"
             self.time_trial_button.bg_color = AWSColors.BUTTON_SECONDARY
             self.time_trial_button.hover_color = AWSColors.BUTTON_SECONDARY_HOVER
-            
-        # Update text surfaces immediately to prevent text overlap
-        self.tutorial_button.text_surface = self.tutorial_button.font.render(
-            self.tutorial_button.text, True, self.tutorial_button.text_color
-        )
-        self.tutorial_button.text_rect = self.tutorial_button.text_surface.get_rect(
-            center=self.tutorial_button.rect.center
-        )
-        
-        self.time_trial_button.text_surface = self.time_trial_button.font.render(
-            self.time_trial_button.text, True, self.time_trial_button.text_color
-        )
-        self.time_trial_button.text_rect = self.time_trial_button.text_surface.get_rect(
-            center=self.time_trial_button.rect.center
-        )
-    
+
     def _wrap_text(self, text: str, font: pygame.font.Font, max_width: int) -> List[str]:
         """
         Wrap text to fit within a given width.
@@ -629,29 +757,4 @@ class MainMenu:
         Returns:
             List of wrapped text lines
         """
-        words = text.split(' ')
-        lines = []
-        current_line = []
-        
-        for word in words:
-            # Try adding the word to the current line
-            test_line = ' '.join(current_line + [word])
-            test_width = font.size(test_line)[0]
-            
-            if test_width <= max_width:
-                # Word fits, add it to the current line
-                current_line.append(word)
-            else:
-                # Word doesn't fit, start a new line
-                if current_line:
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-                else:
-                    # If the word is too long for a single line, force it
-                    lines.append(word)
-        
-        # Add the last line
-        if current_line:
-            lines.append(' '.join(current_line))
-        
-        return lines
\ No newline at end of file
+        return list(wrap_text(font, text, max_width))
\ No newline at end of file
@@ -6,11 +6,18 @@ from typing import Optional, Tuple
 import pygame
 
 from ui.aws_theme import AWSColors, AWSStyling
+from ui.fonts import get_font
 
 
 class Message:
     """Message UI component for displaying temporary messages."""
-    
+
+    __slots__ = (
+        "text", "position", "color", "bg_color", "duration",
+        "creation_time", "alpha", "_fade_start", "font",
+        "text_surface", "text_rect", "bg_rect", "_composite",
+    )
+
     def __init__(
         self,
         text: str,
@@ -38,10 +45,12 @@ class Message:
         self.duration = duration
         self.creation_time = pygame.time.get_ticks()
         self.alpha = 255  # Full opacity
+        # Fade-out only starts during the last second of the lifetime
+        self._fade_start = self.creation_time + duration - 1000
         
-        # Create font if not provided
+        # Use the shared font if not provided
         if font is None:
-            self.font = pygame.font.SysFont(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_MEDIUM)
+            self.font = get_font(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_MEDIUM)
         else:
             self.font = font
         
@@ -57,49 +66,51 @@ class Message:
             self.text_rect.width + padding * 2,
             self.text_rect.height + padding * 2
         )
-        
-    def render(self, surface: pygame.Surface) -> None:
-        """
-        Render the message.
-        
-        Args:
-            surface: Pygame surface to render on
-        """
-        # Calculate time elapsed since creation
-        elapsed = pygame.time.get_ticks() - self.creation_time
-        
-        # Fade out during the last second
-        if elapsed > self.duration - 1000:
-            self.alpha = max(0, int(255 * (1 - (elapsed - (self.duration - 1000)) / 1000)))
-        
-        # Create a surface with alpha channel for the background
-        bg_surface = pygame.Surface((self.bg_rect.width, self.bg_rect.height), pygame.SRCALPHA)
-        bg_color_with_alpha = (*self.bg_color, self.alpha)
+
+        # The message's geometry, colors and text never change, so flatten
+        # background, border and text into one surface; the fade-out is a
+        # per-frame set_alpha on this composite instead of re-rasterizing
+        # two rounded rects and reallocating surfaces every frame
+        self._composite = pygame.Surface((self.bg_rect.width, self.bg_rect.height), pygame.SRCALPHA)
         pygame.draw.rect(
-            bg_surface, 
-            bg_color_with_alpha, 
-            bg_surface.get_rect(),
+            self._composite,
+            self.bg_color,
+            self._composite.get_rect(),
             border_radius=AWSStyling.BORDER_RADIUS_MEDIUM
         )
-        
-        # Draw orange border
-        border_color = (*AWSColors.SMILE_ORANGE, self.alpha)
         pygame.draw.rect(
-            bg_surface, 
-            border_color, 
-            bg_surface.get_rect(),
+            self._composite,
+            AWSColors.SMILE_ORANGE,
+            self._composite.get_rect(),
             width=2,
             border_radius=AWSStyling.BORDER_RADIUS_MEDIUM
         )
-        
-        # Blit background
-        surface.blit(bg_surface, self.bg_rect)
-        
-        # Create a surface with alpha channel for the text
-        text_surface_alpha = pygame.Surface(self.text_surface.get_size(), pygame.SRCALPHA)
-        text_surface_alpha.fill((0, 0, 0, 0))  # Transparent
-        text_surface_alpha.blit(self.text_surface, (0, 0))
-        text_surface_alpha.set_alpha(self.alpha)
-        
-        # Blit text
-        surface.blit(text_surface_alpha, self.text_rect)
\ No newline at end of file
+        self._composite.blit(self.text_surface, (padding, padding))
+        # Match the display's pixel format for the fast blit path
+        self._composite = self._composite.convert_alpha()
+
+    def update_alpha(self) -> None:
+        """Advance the fade-out alpha if the fade has started.
+
+        The composite is opaque until the fade starts; only then does
+        the alpha need recomputing and pushing into the surface.
+        """
+        now = pygame.time.get_ticks()
+        if now > self._fade_start:
+            self.alpha = max(0, int(255 * (1 - (now - self._fade_start) / 1000)))
+            self._composite.set_alpha(self.alpha)
+
+    @property
+    def blit_spec(self) -> Tuple[pygame.Surface, pygame.Rect]:
+        """(surface, dest) pair for batched blitting by the owning manager."""
+        return (self._composite, self.bg_rect)
+
+    def render(self, surface: pygame.Surface) -> None:
+        """
+        Render the message.
+
+        Args:
+            surface: Pygame surface to render on
+        """
+        self.update_alpha()
+        surface.blit(self._composite, self.bg_rect)
\ No newline at end of file
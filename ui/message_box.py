@@ -5,6 +5,8 @@ from typing import Callable, Optional, Tuple
 
 import pygame
 
+from ui.fonts import get_font, wrap_text
+
 
 class MessageBox:
     """Message box UI component for displaying messages to the user."""
@@ -27,7 +29,8 @@ class MessageBox:
             bg_color: Background color (RGB)
             text_color: Text color (RGB)
             border_color: Border color (RGB)
-            timeout: Frames until the message box disappears (None for no timeout)
+            timeout: Frames (at the 60 FPS target) until the message box
+                disappears (None for no timeout)
         """
         self.message = message
         self.rect = rect
@@ -35,13 +38,55 @@ class MessageBox:
         self.text_color = text_color
         self.border_color = border_color
         self.timeout = timeout
-        self.active = True
+        self.dismissed = False
+
+        # Convert the frame count to a wall-clock expiry so the lifetime
+        # is framerate-independent and needs no per-frame bookkeeping
+        if timeout is not None:
+            self._expire_ms: Optional[int] = pygame.time.get_ticks() + int(timeout * 1000 / 60)
+        else:
+            self._expire_ms = None
         
-        # Create font
-        self.font = pygame.font.SysFont("Arial", 16)
+        # Use the shared font
+        self.font = get_font("Arial", 16)
         
         # Wrap text to fit in the message box
         self.wrapped_text = self._wrap_text(message, rect.width - 20)
+
+        # Message, geometry and colors are fixed after construction, so
+        # flatten background, border and text lines into one surface;
+        # rendering is then a single blit per frame
+        self._image = self._build_image()
+
+    def _build_image(self) -> pygame.Surface:
+        """
+        Build the message box's composite surface.
+
+        Returns:
+            Surface with background, border and text pre-rendered
+        """
+        image = pygame.Surface(self.rect.size)
+        image.fill(self.bg_color)
+        pygame.draw.rect(image, self.border_color, image.get_rect(), 2)
+
+        y = 20
+        for line in self.wrapped_text:
+            text_surface = self.font.render(line, True, self.text_color)
+            text_rect = text_surface.get_rect(centerx=self.rect.width // 2, top=y)
+            image.blit(text_surface, text_rect)
+            y += text_surface.get_height() + 5
+
+        # Draw the "Click to continue" text for boxes without a timeout
+        if self.timeout is None:
+            close_text = self.font.render("Click to continue", True, self.text_color)
+            close_rect = close_text.get_rect(
+                centerx=self.rect.width // 2,
+                bottom=self.rect.height - 15
+            )
+            image.blit(close_text, close_rect)
+
+        # Match the display's pixel format for the fast blit path
+        return image.convert()
     
     def _wrap_text(self, text: str, max_width: int) -> list:
         """
@@ -54,39 +99,21 @@ class MessageBox:
         Returns:
             List of wrapped text lines
         """
-        words = text.split(' ')
-        lines = []
-        current_line = []
-        
-        for word in words:
-            # Try adding the word to the current line
-            test_line = ' '.join(current_line + [word])
-            test_width = self.font.size(test_line)[0]
-            
-            if test_width <= max_width:
-                # Word fits, add it to the current line
-                current_line.append(word)
-            else:
-                # Word doesn't fit, start a new line
-                if current_line:
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-                else:
-                    # If the word is too long for a single line, force it
-                    lines.append(word)
-        
-        # Add the last line
-        if current_line:
-            lines.append(' '.join(current_line))
-        
-        return lines
+        return list(wrap_text(self.font, text, max_width))
     
+    @property
+    def active(self) -> bool:
+        """Whether the message box is still visible."""
+        if self.dismissed:
+            return False
+        return self._expire_ms is None or pygame.time.get_ticks() < self._expire_ms
+
     def update(self) -> None:
-        """Update the message box state."""
-        if self.timeout is not None:
-            self.timeout -= 1
-            if self.timeout <= 0:
-                self.active = False
+        """Update the message box state.
+
+        Kept for API compatibility; the timeout is now an expiry
+        timestamp checked by ``active``, so there is nothing to tick.
+        """
     
     def render(self, surface: pygame.Surface) -> None:
         """
@@ -97,28 +124,9 @@ class MessageBox:
         """
         if not self.active:
             return
-            
-        # Draw message box background
-        pygame.draw.rect(surface, self.bg_color, self.rect)
-        pygame.draw.rect(surface, self.border_color, self.rect, 2)
-        
-        # Draw text
-        y = self.rect.top + 20
-        for line in self.wrapped_text:
-            text_surface = self.font.render(line, True, self.text_color)
-            text_rect = text_surface.get_rect(centerx=self.rect.centerx, top=y)
-            surface.blit(text_surface, text_rect)
-            y += text_surface.get_height() + 5
-        
-        # Draw close button or "Click to continue" text
-        if self.timeout is None:
-            close_text = self.font.render("Click to continue", True, self.text_color)
-            close_rect = close_text.get_rect(
-                centerx=self.rect.centerx,
-                bottom=self.rect.bottom - 15
-            )
-            surface.blit(close_text, close_rect)
+
+        surface.blit(self._image, self.rect)
     
     def on_click(self) -> None:
         """Handle click on the message box."""
-        self.active = False
\ No newline at end of file
+        self.dismissed = True
\ No newline at end of file
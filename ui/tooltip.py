@@ -5,10 +5,17 @@ from typing import List, Tuple
 
 import pygame
 
+from ui.fonts import get_font
+
 
 class Tooltip:
     """Tooltip UI component for displaying additional information."""
-    
+
+    __slots__ = (
+        "position", "content", "bg_color", "text_color", "border_color",
+        "padding", "max_width", "font", "text_surfaces", "rect", "image",
+    )
+
     def __init__(
         self,
         position: Tuple[int, int],
@@ -39,8 +46,8 @@ class Tooltip:
         self.padding = padding
         self.max_width = max_width
         
-        # Create font
-        self.font = pygame.font.SysFont("Arial", 14)
+        # Use the shared font
+        self.font = get_font("Arial", 14)
         
         # Create text surfaces
         self.text_surfaces = [
@@ -63,21 +70,25 @@ class Tooltip:
             self.rect.right = screen_width - 5
         if self.rect.bottom > screen_height:
             self.rect.bottom = screen_height - 5
-    
+
+        # The content is immutable after construction, so flatten the
+        # background, border and text lines into one surface; rendering
+        # is then a single blit per frame instead of 2 + N draw calls
+        self.image = pygame.Surface((width, height))
+        self.image.fill(bg_color)
+        pygame.draw.rect(self.image, border_color, self.image.get_rect(), 1)
+        y = padding
+        for text_surface in self.text_surfaces:
+            self.image.blit(text_surface, (padding, y))
+            y += text_surface.get_height()
+        # Match the display's pixel format for the fast blit path
+        self.image = self.image.convert()
+
     def render(self, surface: pygame.Surface) -> None:
         """
         Render the tooltip.
-        
+
         Args:
             surface: Pygame surface to render on
         """
-        # Draw tooltip background
-        pygame.draw.rect(surface, self.bg_color, self.rect)
-        pygame.draw.rect(surface, self.border_color, self.rect, 1)
-        
-        # Draw text
-        y = self.rect.top + self.padding
-        for text_surface in self.text_surfaces:
-            x = self.rect.left + self.padding
-            surface.blit(text_surface, (x, y))
-            y += text_surface.get_height()
\ No newline at end of file
+        surface.blit(self.image, self.rect)
\ No newline at end of file
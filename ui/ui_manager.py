@@ -1,19 +1,41 @@
 """
 UI manager module for managing UI components.
 """
-from typing import Any, Dict, List, Optional, Tuple
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 import pygame
 
 from ui.aws_theme import AWSColors, AWSStyling
 from ui.button import Button
+from ui.fonts import get_font
 from ui.hud import HUD
 from ui.message import Message
 
+# One-shot timer event that fires when a hovered button's tooltip is due;
+# USEREVENT itself is taken by the time-out timer
+TOOLTIP_EVENT = pygame.USEREVENT + 1
+
 
 class UIManager:
     """Manages UI components and interactions."""
-    
+
+    __slots__ = (
+        "game", "_win_w", "_win_h", "_hud_h", "hud", "buttons",
+        "messages", "message_duration", "tooltip", "tooltip_delay",
+        "tooltip_target", "_tooltip_cache",
+        "_tooltip_max_right", "_tooltip_max_bottom",
+        "_last_motion_time", "_last_motion_pos", "_hovered",
+    )
+
+    # Tooltip text per target
+    _TOOLTIP_TEXT = {
+        "validate": "Validate your architecture against level requirements",
+        "menu": "Return to the main menu",
+        "help": "Show help information",
+    }
+
+
     def __init__(self, game: Any) -> None:
         """
         Initialize the UI manager.
@@ -22,15 +44,38 @@ class UIManager:
             game: Reference to the main game object
         """
         self.game = game
+        # Window geometry is fixed after init; cache it off the config
+        # chain so the hot paths skip the repeated attribute walks
+        self._win_w = game.config.window.width
+        self._win_h = game.config.window.height
+        self._hud_h = game.config.ui.hud_height
         self.hud = HUD(game)
         self.buttons = []
-        self.messages = []
+        # Messages are appended in creation order, so only the head can
+        # expire; a deque makes the expiry check O(expired) per frame
+        self.messages: Deque[Message] = deque()
         self.message_duration = 3000  # 3 seconds
         self.tooltip = None
         self.tooltip_delay = 500  # milliseconds
-        self.tooltip_timer = 0
         self.tooltip_target = None
-        
+
+        # Rendered tooltip surfaces keyed by text; the three tooltip
+        # strings are fixed, so each rasterizes once and blits thereafter
+        self._tooltip_cache: Dict[str, pygame.Surface] = {}
+
+        # On-screen clamp bounds for the tooltip, computed once
+        self._tooltip_max_right = self._win_w - 5
+        self._tooltip_max_bottom = self._win_h - 5
+
+        # Mouse-motion throttling state: motion is the highest-frequency
+        # event, so near-duplicate events within a frame are dropped
+        self._last_motion_time = 0
+        self._last_motion_pos = (-1, -1)
+
+        # Button the mouse is currently over, so motion events inside the
+        # same button skip re-testing every rect
+        self._hovered: Optional[Button] = None
+
         # Create UI buttons
         self._create_buttons()
     
@@ -39,8 +84,8 @@ class UIManager:
         # Validate architecture button
         validate_button = Button(
             rect=pygame.Rect(
-                self.game.config.window.width - 220,
-                self.game.config.window.height - self.game.config.ui.hud_height + 25,
+                self._win_w - 220,
+                self._win_h - self._hud_h + 25,
                 200,
                 50
             ),
@@ -48,12 +93,13 @@ class UIManager:
             callback=self._on_validate_click,
             style="primary"
         )
+        validate_button.tooltip_target = "validate"
         self.buttons.append(validate_button)
         
         # Menu button
         menu_button = Button(
             rect=pygame.Rect(
-                self.game.config.window.width - 100,
+                self._win_w - 100,
                 10,
                 80,
                 30
@@ -62,12 +108,13 @@ class UIManager:
             callback=self._on_menu_click,
             style="secondary"
         )
+        menu_button.tooltip_target = "menu"
         self.buttons.append(menu_button)
         
         # Help button
         help_button = Button(
             rect=pygame.Rect(
-                self.game.config.window.width - 150,
+                self._win_w - 150,
                 10,
                 40,
                 30
@@ -76,26 +123,23 @@ class UIManager:
             callback=self._on_help_click,
             style="secondary"
         )
+        help_button.tooltip_target = "help"
         self.buttons.append(help_button)
     
-    def update(self) -> None:
-        """Update UI components."""
+    def update(self, current_time: int) -> None:
+        """
+        Update UI components.
+
+        Args:
+            current_time: Frame timestamp from pygame.time.get_ticks()
+        """
         # Update HUD
         self.hud.update()
-        
-        # Update messages
-        current_time = pygame.time.get_ticks()
-        self.messages = [msg for msg in self.messages if current_time - msg.creation_time < self.message_duration]
-        
-        # Update tooltip
-        if self.tooltip_target and current_time - self.tooltip_timer > self.tooltip_delay:
-            # Show tooltip
-            if self.tooltip_target == "validate":
-                self.tooltip = "Validate your architecture against level requirements"
-            elif self.tooltip_target == "menu":
-                self.tooltip = "Return to the main menu"
-            elif self.tooltip_target == "help":
-                self.tooltip = "Show help information"
+
+        # Expire messages from the head of the deque; creation order means
+        # nothing behind an unexpired message can have expired
+        while self.messages and current_time - self.messages[0].creation_time >= self.message_duration:
+            self.messages.popleft()
     
     def render(self, surface: pygame.Surface) -> None:
         """
@@ -107,13 +151,14 @@ class UIManager:
         # Render HUD
         self.hud.render(surface)
         
-        # Render buttons
-        for button in self.buttons:
-            button.render(surface)
-        
-        # Render messages
+        # Buttons and messages are pre-composited surfaces; hand them to
+        # SDL in one batched call (messages draw after, hence on top of,
+        # the buttons)
+        blit_list = [(button.image, button.rect) for button in self.buttons]
         for message in self.messages:
-            message.render(surface)
+            message.update_alpha()
+            blit_list.append(message.blit_spec)
+        surface.blits(blit_list, doreturn=0)
             
         # Render tooltip if active
         if self.tooltip:
@@ -130,10 +175,11 @@ class UIManager:
         Returns:
             True if the event was handled, False otherwise
         """
-        # Reset tooltip
+        # Reset tooltip and cancel any pending tooltip timer
         self.tooltip = None
         self.tooltip_target = None
-        
+        pygame.time.set_timer(TOOLTIP_EVENT, 0)
+
         # Check button clicks
         for button in self.buttons:
             if button.rect.collidepoint(event.pos):
@@ -162,26 +208,49 @@ class UIManager:
         Args:
             event: Pygame mouse motion event
         """
-        # Update button hover states
-        for i, button in enumerate(self.buttons):
-            was_hovered = button.is_hovered
-            button.is_hovered = button.rect.collidepoint(event.pos)
-            
-            # Start tooltip timer if newly hovered
-            if button.is_hovered and not was_hovered:
-                self.tooltip_timer = pygame.time.get_ticks()
-                if i == 0:  # Validate button
-                    self.tooltip_target = "validate"
-                elif i == 1:  # Menu button
-                    self.tooltip_target = "menu"
-                elif i == 2:  # Help button
-                    self.tooltip_target = "help"
-            
-            # Reset tooltip if no longer hovering
-            if not button.is_hovered and was_hovered and self.tooltip_target:
-                self.tooltip = None
-                self.tooltip_target = None
+        # Drop near-duplicate motion events: hover state cannot change
+        # meaningfully within a frame and a couple of pixels
+        now = pygame.time.get_ticks()
+        pos = event.pos
+        if (
+            now - self._last_motion_time < 16
+            and abs(pos[0] - self._last_motion_pos[0]) + abs(pos[1] - self._last_motion_pos[1]) < 2
+        ):
+            return
+        self._last_motion_time = now
+        self._last_motion_pos = pos
+
+        # Fast path: still inside the same button, nothing changes
+        if self._hovered is not None and self._hovered.rect.collidepoint(pos):
+            return
+
+        # Hover state changed: find the newly-hovered button (rects are
+        # disjoint, so at most one matches) and clear only the old one
+        previous = self._hovered
+        self._hovered = None
+        for button in self.buttons:
+            if button.rect.collidepoint(pos):
+                button.is_hovered = True
+                self._hovered = button
+                # Schedule a one-shot tooltip timer for the new button;
+                # re-arming also resets any pending one
+                self.tooltip_target = button.tooltip_target
+                pygame.time.set_timer(TOOLTIP_EVENT, self.tooltip_delay, loops=1)
+                break
+        if previous is not None:
+            previous.is_hovered = False
+
+        # Reset tooltip if no longer hovering any button
+        if self._hovered is None and self.tooltip_target:
+            self.tooltip = None
+            self.tooltip_target = None
+            pygame.time.set_timer(TOOLTIP_EVENT, 0)
     
+    def on_tooltip_timer(self) -> None:
+        """Show the pending tooltip when its one-shot timer fires."""
+        if self.tooltip_target:
+            self.tooltip = self._TOOLTIP_TEXT.get(self.tooltip_target)
+
     def show_message(self, text: str) -> None:
         """
         Show a message on the screen.
@@ -191,8 +260,8 @@ class UIManager:
         """
         message = Message(
             text=text,
-            position=(self.game.config.window.width // 2, 100),
-            font=pygame.font.SysFont(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_LARGE),
+            position=(self._win_w // 2, 100),
+            font=get_font(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_LARGE),
             color=AWSColors.WHITE,
             bg_color=AWSColors.SQUID_INK
         )
@@ -207,36 +276,42 @@ class UIManager:
             text: Tooltip text
             pos: Position (x, y) to render the tooltip
         """
-        # Create font and render text
-        font = pygame.font.SysFont(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_SMALL)
-        text_surface = font.render(text, True, AWSColors.WHITE)
-        
-        # Calculate tooltip dimensions
-        padding = AWSStyling.PADDING_SMALL
-        tooltip_width = text_surface.get_width() + padding * 2
-        tooltip_height = text_surface.get_height() + padding * 2
-        
-        # Create tooltip rectangle
-        tooltip_rect = pygame.Rect(
-            pos[0] + 15,  # Offset from cursor
-            pos[1] + 15,
-            tooltip_width,
-            tooltip_height
-        )
-        
+        # The tooltip strings are fixed, so the background, border and
+        # text rasterize once per text; only the position changes per frame
+        tooltip_surface = self._tooltip_cache.get(text)
+        if tooltip_surface is None:
+            font = get_font(AWSStyling.FONT_FAMILY, AWSStyling.FONT_SIZE_SMALL)
+            text_surface = font.render(text, True, AWSColors.WHITE)
+
+            padding = AWSStyling.PADDING_SMALL
+            tooltip_surface = pygame.Surface(
+                (text_surface.get_width() + padding * 2, text_surface.get_height() + padding * 2),
+                pygame.SRCALPHA
+            )
+            pygame.draw.rect(
+                tooltip_surface, AWSColors.SQUID_INK, tooltip_surface.get_rect(),
+                border_radius=AWSStyling.BORDER_RADIUS_SMALL
+            )
+            pygame.draw.rect(
+                tooltip_surface, AWSColors.SMILE_ORANGE, tooltip_surface.get_rect(), 1,
+                border_radius=AWSStyling.BORDER_RADIUS_SMALL
+            )
+            text_rect = text_surface.get_rect(center=tooltip_surface.get_rect().center)
+            tooltip_surface.blit(text_surface, text_rect)
+            # Match the display's pixel format for the fast blit path
+            tooltip_surface = tooltip_surface.convert_alpha()
+            self._tooltip_cache[text] = tooltip_surface
+
+        # Create tooltip rectangle, offset from the cursor
+        tooltip_rect = tooltip_surface.get_rect(topleft=(pos[0] + 15, pos[1] + 15))
+
         # Keep tooltip on screen
-        if tooltip_rect.right > self.game.config.window.width:
-            tooltip_rect.right = self.game.config.window.width - 5
-        if tooltip_rect.bottom > self.game.config.window.height:
-            tooltip_rect.bottom = self.game.config.window.height - 5
-        
-        # Draw tooltip background
-        pygame.draw.rect(surface, AWSColors.SQUID_INK, tooltip_rect, border_radius=AWSStyling.BORDER_RADIUS_SMALL)
-        pygame.draw.rect(surface, AWSColors.SMILE_ORANGE, tooltip_rect, 1, border_radius=AWSStyling.BORDER_RADIUS_SMALL)
-        
-        # Draw tooltip text
-        text_rect = text_surface.get_rect(center=tooltip_rect.center)
-        surface.blit(text_surface, text_rect)
+        if tooltip_rect.right > self._tooltip_max_right:
+            tooltip_rect.right = self._tooltip_max_right
+        if tooltip_rect.bottom > self._tooltip_max_bottom:
+            tooltip_rect.bottom = self._tooltip_max_bottom
+
+        surface.blit(tooltip_surface, tooltip_rect)
     
     def _on_validate_click(self) -> None:
         """Handle click on the validate architecture button."""